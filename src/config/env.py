@@ -0,0 +1,28 @@
+"""
+.env 환경변수 로드 (프로세스당 한 번)
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+# .env.example에 정의된 환경변수들
+ENV_KEYS = ("ANTHROPIC_AUTH_TOKEN", "ANTHROPIC_BASE_URL", "GEMINI_API_KEY")
+
+_loaded = False
+
+
+def load_env() -> None:
+    """.env 파일 로드 (이미 로드했거나 필요한 값이 모두 설정되어 있으면 생략)"""
+    global _loaded
+
+    if _loaded:
+        return
+    _loaded = True
+
+    # 컨테이너/CI처럼 환경변수가 이미 주입된 경우 파일 I/O 없이 종료
+    if all(os.environ.get(key) for key in ENV_KEYS):
+        return
+
+    # 이미 설정된 환경변수는 덮어쓰지 않음
+    load_dotenv(override=False)
@@ -2,22 +2,19 @@
 사이트별 스크래핑 설정 관리
 """
 
-from typing import Dict, List, Optional
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 from src.models.schemas import ScrapingConfig, ScrapingSourceType, SPAConfig
+from src.utils.rate_limiter import domain_rate_limiter
+from src.utils.url_utils import parse_url
 
-
-class SiteConfigManager:
-    """사이트별 스크래핑 설정을 관리하는 클래스"""
-
-    def __init__(self):
-        self._configs: Dict[str, ScrapingConfig] = {}
-        self._initialize_default_configs()
-
-    def _initialize_default_configs(self):
-        """기본 사이트 설정들을 초기화"""
-
+# 모듈 로드 시 한 번만 검증/생성하는 설정 프리셋
+# frozen 모델도 dict/list 필드는 수정 가능하므로 외부에는 항상 깊은 복사본을 반환
+_FROZEN_CONFIGS: Mapping[str, ScrapingConfig] = MappingProxyType(
+    {
         # 세니아 클리닉 (sitemap 기반)
-        self._configs["xenia"] = ScrapingConfig(
+        "xenia": ScrapingConfig(
             site_name="Xenia Clinic",
             base_url="https://xenia.clinic/",
             source_type=ScrapingSourceType.SITEMAP,
@@ -26,11 +23,11 @@ class SiteConfigManager:
             custom_settings={
                 "priority_keywords": ["products", "treatment", "ko"],
                 "exclude_patterns": ["/en/", "/blog/", "/news/"],
+                "sitemap_max_age": 48 * 3600,  # 파싱된 sitemap URL 캐시 유지 시간(초)
             },
-        )
-
+        ),
         # 쁨 글로벌 클리닉 (base_url + SPA 기반)
-        self._configs["ppeum_global"] = ScrapingConfig(
+        "ppeum_global": ScrapingConfig(
             site_name="PPEUM Global Clinic",
             base_url="https://global.ppeum.com/",
             source_type=ScrapingSourceType.SPA_DYNAMIC,
@@ -57,10 +54,9 @@ class SiteConfigManager:
                 "dynamic_content": True,
                 "requires_interaction": True,
             },
-        )
-
+        ),
         # GU 클리닉 (기존 설정 유지)
-        self._configs["gu_clinic"] = ScrapingConfig(
+        "gu_clinic": ScrapingConfig(
             site_name="GU Clinic",
             base_url="https://gu.clinic/",
             source_type=ScrapingSourceType.STATIC_URLS,
@@ -73,51 +69,21 @@ class SiteConfigManager:
             rate_limit=1.5,
             use_selenium=True,
             custom_settings={"spa_like": True, "category_based": True},
-        )
-
+        ),
         # Beauty Leader (sitemap 기반)
-        self._configs["beauty_leader"] = ScrapingConfig(
+        "beauty_leader": ScrapingConfig(
             site_name="Beauty Leader",
             base_url="https://beautyleader.co.kr/",
             source_type=ScrapingSourceType.SITEMAP,
             rate_limit=1.0,
             use_selenium=False,
             custom_settings={
-                "priority_keywords": ["treatment", "service", "procedure"]
+                "priority_keywords": ["treatment", "service", "procedure"],
+                "sitemap_max_age": 48 * 3600,
             },
-        )
-
-    def get_config(self, site_key: str) -> Optional[ScrapingConfig]:
-        """사이트 키로 설정을 가져옴"""
-        return self._configs.get(site_key)
-
-    def add_config(self, site_key: str, config: ScrapingConfig) -> None:
-        """새 사이트 설정을 추가"""
-        self._configs[site_key] = config
-
-    def list_sites(self) -> List[str]:
-        """등록된 모든 사이트 키를 반환"""
-        return list(self._configs.keys())
-
-    def get_spa_sites(self) -> List[str]:
-        """SPA 타입 사이트들을 반환"""
-        return [
-            key
-            for key, config in self._configs.items()
-            if config.source_type == ScrapingSourceType.SPA_DYNAMIC
-        ]
-
-    def get_sitemap_sites(self) -> List[str]:
-        """Sitemap 기반 사이트들을 반환"""
-        return [
-            key
-            for key, config in self._configs.items()
-            if config.source_type == ScrapingSourceType.SITEMAP
-        ]
-
-    def create_ppeum_global_config(self) -> ScrapingConfig:
-        """쁨 글로벌 클리닉 전용 설정 생성"""
-        return ScrapingConfig(
+        ),
+        # 쁨 글로벌 클리닉 보수적 설정 (create_ppeum_global_config 전용)
+        "ppeum_global_strict": ScrapingConfig(
             site_name="PPEUM Global",
             base_url="https://global.ppeum.com/",
             source_type=ScrapingSourceType.SPA_DYNAMIC,
@@ -151,7 +117,92 @@ class SiteConfigManager:
                 "korean_site": True,
                 "beauty_clinic": True,
             },
-        )
+        ),
+    }
+)
+
+# 기본 등록 사이트 (ppeum_global_strict는 프리셋으로만 사용)
+_DEFAULT_SITE_KEYS = ("xenia", "ppeum_global", "gu_clinic", "beauty_leader")
+
+
+class SiteConfigManager:
+    """사이트별 스크래핑 설정을 관리하는 클래스"""
+
+    def __init__(self):
+        self._configs: Dict[str, ScrapingConfig] = {}
+        # 조회용 역인덱스 (설정 등록 시점에 갱신)
+        self._by_source_type: Dict[ScrapingSourceType, List[str]] = defaultdict(list)
+        self._by_netloc: Dict[str, str] = {}  # netloc → site_key
+        self._initialize_default_configs()
+
+    def _initialize_default_configs(self):
+        """기본 사이트 설정들을 초기화 (프리셋은 검증 없이 복사만 하여 등록)"""
+        for site_key in _DEFAULT_SITE_KEYS:
+            self._register(site_key, _FROZEN_CONFIGS[site_key].model_copy(deep=True))
+
+    def _register(self, site_key: str, config: ScrapingConfig) -> None:
+        """설정 저장 및 역인덱스/rate limiter 갱신"""
+        previous = self._configs.get(site_key)
+        if previous is not None:
+            # 이전 설정의 역인덱스 항목 제거 (다른 사이트가 덮어쓴 도메인은 유지)
+            self._by_source_type[previous.source_type].remove(site_key)
+            for url in [previous.base_url, *previous.static_urls]:
+                netloc = parse_url(url).netloc
+                if self._by_netloc.get(netloc) == site_key:
+                    del self._by_netloc[netloc]
+
+        self._configs[site_key] = config
+        self._by_source_type[config.source_type].append(site_key)
+        for url in [config.base_url, *config.static_urls]:
+            self._by_netloc[parse_url(url).netloc] = site_key
+
+        self._register_rate_limit(config)
+
+    def _register_rate_limit(self, config: ScrapingConfig) -> None:
+        """설정의 base_url/static_urls 도메인에 요청 간격 등록"""
+        for url in [config.base_url, *config.static_urls]:
+            domain_rate_limiter.register(url, config.rate_limit)
+
+    def get_config(self, site_key: str) -> Optional[ScrapingConfig]:
+        """사이트 키로 설정을 가져옴 (수정해도 등록된 설정에 영향이 없는 복사본)"""
+        config = self._configs.get(site_key)
+        return config.model_copy(deep=True) if config is not None else None
+
+    def get_cached_sitemap(self, site_key: str) -> Optional[List[str]]:
+        """사이트의 캐시된 sitemap URL 목록 반환 (캐시가 없으면 None)"""
+        # playwright 등 스크래퍼 의존성을 설정 로드 시점에 불러오지 않도록 지연 import
+        from src.scrapers.sitemap_scraper import get_cached_sitemap_urls
+
+        config = self._configs.get(site_key)
+        if config is None or config.source_type != ScrapingSourceType.SITEMAP:
+            return None
+        return get_cached_sitemap_urls(config)
+
+    def add_config(self, site_key: str, config: ScrapingConfig) -> None:
+        """새 사이트 설정을 추가"""
+        self._register(site_key, config)
+
+    def list_sites(self) -> List[str]:
+        """등록된 모든 사이트 키를 반환"""
+        return list(self._configs.keys())
+
+    def get_spa_sites(self) -> List[str]:
+        """SPA 타입 사이트들을 반환"""
+        return list(self._by_source_type[ScrapingSourceType.SPA_DYNAMIC])
+
+    def get_sitemap_sites(self) -> List[str]:
+        """Sitemap 기반 사이트들을 반환"""
+        return list(self._by_source_type[ScrapingSourceType.SITEMAP])
+
+    def lookup_by_url(self, url: str) -> Optional[str]:
+        """URL의 도메인으로 사이트 키를 찾음 (등록되지 않은 도메인이면 None)"""
+        return self._by_netloc.get(parse_url(url).netloc)
+
+    def create_ppeum_global_config(self) -> ScrapingConfig:
+        """쁨 글로벌 클리닉 전용 설정 반환 (호출마다 새 복사본)"""
+        config = _FROZEN_CONFIGS["ppeum_global_strict"]
+        self._register_rate_limit(config)
+        return config.model_copy(deep=True)
 
 
 # 전역 설정 관리자 인스턴스
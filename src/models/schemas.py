@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from pydantic import BaseModel, Field
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -124,14 +125,25 @@ class ScrapingSourceType(str, Enum):
 class SPAConfig(BaseModel):
     """SPA 사이트 동적 콘텐츠 스크래핑 설정"""
 
+    # 설정 인스턴스를 여러 스크래퍼/태스크에서 공유하므로 불변으로 유지
+    model_config = ConfigDict(frozen=True)
+
     wait_for_element: Optional[str] = None  # 기다릴 요소 선택자
     click_elements: List[str] = []  # 클릭할 버튼/요소들
     scroll_behavior: bool = False  # 스크롤하여 더 많은 콘텐츠 로드
     wait_time: int = 3  # 페이지 로딩 대기 시간(초)
     max_interactions: int = 10  # 최대 상호작용 횟수
+    debug_html_dump: bool = False  # 상호작용별 HTML 샘플을 log/errors에 저장
+
+    @cached_property
+    def combined_click_selector(self) -> str:
+        """click_elements를 하나의 CSS 선택자로 결합 (한 번의 DOM 조회로 모든 후보 탐색)"""
+        return ", ".join(self.click_elements)
 
 
 class ScrapingConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     site_name: str
     base_url: str
 
@@ -145,6 +157,10 @@ class ScrapingConfig(BaseModel):
     # 기존 설정들
     selectors: Dict[str, str] = {}
     rate_limit: float = 1.0
+    max_concurrency: int = 5  # 동시에 처리할 최대 URL 수
+    max_concurrency_per_host: int = 4  # 같은 호스트에 동시에 보낼 최대 요청 수
+    llm_batch_size: int = 4  # 한 번의 LLM 요청에 묶을 최대 페이지 수
+    checkpoint_path: Optional[str] = None  # 기본값: .checkpoints/{site_name}.jsonl
     use_selenium: bool = False
     headers: Dict[str, str] = {}
 
@@ -152,7 +168,7 @@ class ScrapingConfig(BaseModel):
     custom_settings: Dict[str, Any] = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingResult:
     """스크래핑 결과 데이터 클래스"""
 
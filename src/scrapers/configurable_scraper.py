@@ -1,52 +1,44 @@
 import asyncio
-from typing import List
+import itertools
+from typing import AsyncIterator, List, Optional, Set, Tuple
+
+import aiohttp
 
 from src.models.schemas import ProductItem, ScrapingConfig, ScrapingSourceType
 from src.scrapers.sitemap_scraper import SitemapScraper
 from src.scrapers.spa_scraper import SPAContentScraper
+from src.utils.checkpoint import ScrapeCheckpoint
+from src.utils.llm_batcher import LLMBatcher
 from src.utils.llm_extractor import LLMTreatmentExtractor
+from src.utils.llm_providers import LLMAuthError, LLMRateLimitError
+from src.utils.log import get_logger
+from src.utils.rate_limiter import host_concurrency_limiter
+
+logger = get_logger(__name__)
 
 
 class ConfigurableScraper:
     """통합 설정 기반 스크래퍼 (Claude/Gemini 지원)"""
 
-    def __init__(self, config: ScrapingConfig, llm_extractor: LLMTreatmentExtractor):
+    def __init__(
+        self,
+        config: ScrapingConfig,
+        llm_extractor: LLMTreatmentExtractor,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
         self.config = config
         self.llm_extractor = llm_extractor
+        self.session = session
 
     async def scrape_by_config(self) -> List[ProductItem]:
         """설정에 따라 스크래핑 수행"""
         all_products = []
 
         if self.config.source_type == ScrapingSourceType.STATIC_URLS:
-            # 정적 URL 병렬 스크래핑 (Promise.all 방식)
-            print(f"🚀 {len(self.config.static_urls)}개 URL 병렬 스크래핑 시작...")
-
-            async def scrape_single_url(url: str) -> List[ProductItem]:
-                """단일 URL 스크래핑"""
-                try:
-                    print(f"📄 스크래핑 중: {url}")
-                    products = await self.llm_extractor.extract_treatments_from_url(url)
-                    print(f"✅ {url}: {len(products)}개 상품 추출")
-                    return products
-                except Exception as e:
-                    print(f"❌ URL 스크래핑 실패 {url}: {str(e)}")
-                    return []
-
-            # 모든 URL을 병렬로 처리 (Promise.all과 동일)
-            tasks = [scrape_single_url(url) for url in self.config.static_urls]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # 결과 수집
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    print(
-                        f"❌ URL {self.config.static_urls[i]} 처리 중 예외: {str(result)}"
-                    )
-                else:
-                    all_products.extend(result)
+            # 정적 URL 병렬 스크래핑 (동시 실행 수 제한)
+            all_products = await self.scrape_batch(self.config.static_urls)
 
-            print(f"🎉 병렬 스크래핑 완료: 총 {len(all_products)}개 상품 수집")
+            logger.info(f"🎉 병렬 스크래핑 완료: 총 {len(all_products)}개 상품 수집")
 
         elif self.config.source_type == ScrapingSourceType.SPA_DYNAMIC:
             # SPA 동적 스크래핑
@@ -65,20 +57,157 @@ class ConfigurableScraper:
             result = await spa_scraper.scrape_spa_content(start_url)
 
             if result.error:
-                print(f"❌ SPA 스크래핑 오류: {result.error}")
+                logger.info(f"❌ SPA 스크래핑 오류: {result.error}")
             else:
-                all_products.extend(result.products)
-                print(
+                logger.info(
                     f"✅ SPA 스크래핑 완료: {len(result.products)}개 제품, {result.interactions_performed}번 상호작용"
                 )
+                # 결과 리스트를 복사하지 않고 그대로 반환
+                return result.products
 
         elif self.config.source_type == ScrapingSourceType.SITEMAP:
             # Sitemap 기반 스크래핑
-            sitemap_scraper = SitemapScraper(self.config, self.llm_extractor)
+            sitemap_scraper = SitemapScraper(
+                self.config, self.llm_extractor, self.session
+            )
 
             result_products = await sitemap_scraper.scrape_sitemap_content()
-            all_products.extend(result_products)
 
-            print(f"✅ Sitemap 스크래핑 완료: {len(result_products)}개 제품")
+            logger.info(f"✅ Sitemap 스크래핑 완료: {len(result_products)}개 제품")
+            # 결과 리스트를 복사하지 않고 그대로 반환
+            return result_products
+
+        return all_products
 
+    async def iter_products(self) -> AsyncIterator[ProductItem]:
+        """설정에 따라 스크래핑하며 추출된 상품을 준비되는 대로 반환"""
+        if self.config.source_type == ScrapingSourceType.STATIC_URLS:
+            # 정적 URL은 URL 하나가 끝날 때마다 바로 전달 (전체 완료를 기다리지 않음)
+            async for _, products in self._iter_batch(self.config.static_urls):
+                for product in products:
+                    yield product
+        else:
+            for product in await self.scrape_by_config():
+                yield product
+
+    async def scrape_batch(self, urls: List[str]) -> List[ProductItem]:
+        """여러 URL을 max_concurrency 개수만큼 동시에 스크래핑 (체크포인트로 재개 가능)"""
+        completed = {url: products async for url, products in self._iter_batch(urls)}
+
+        # 결과 수집 (입력 URL 순서 유지)
+        all_products = []
+        for url in urls:
+            all_products.extend(completed.get(url, []))
         return all_products
+
+    async def _iter_batch(
+        self, urls: List[str]
+    ) -> AsyncIterator[Tuple[str, List[ProductItem]]]:
+        """URL별 (url, 상품 리스트)를 완료되는 순서대로 반환"""
+        checkpoint = ScrapeCheckpoint(self._checkpoint_path())
+        completed = checkpoint.load()
+        pending_urls = [url for url in urls if url not in completed]
+        if len(pending_urls) < len(urls):
+            logger.info(
+                f"♻️  체크포인트에서 {len(urls) - len(pending_urls)}개 URL 결과 복원: {checkpoint.path}"
+            )
+            for url in urls:
+                if url in completed:
+                    yield url, completed[url]
+
+        # 완료 여부만 추적하고 상품 리스트는 넘긴 뒤 보관하지 않음 (URL 수만큼 메모리가 늘지 않음)
+        done_urls = set(completed)
+        del completed
+
+        logger.info(
+            f"🚀 {len(pending_urls)}개 URL 병렬 스크래핑 시작... (동시 실행: {self.config.max_concurrency})"
+        )
+
+        # 동시에 진행 중인 URL들을 모아 LLM 요청 하나로 추출
+        async with LLMBatcher(
+            self.llm_extractor,
+            max_batch=self.config.llm_batch_size,
+            # JavaScript가 필요 없는 사이트는 브라우저 없이 정적 HTML 사용
+            render_js=self.config.use_selenium,
+        ) as batcher:
+
+            async def scrape_with_limit(
+                url: str,
+            ) -> Tuple[str, Optional[List[ProductItem]]]:
+                try:
+                    # 호스트별/프로세스 전체 동시 요청 수 제한
+                    async with host_concurrency_limiter.limit(
+                        url, self.config.max_concurrency_per_host
+                    ):
+                        return url, await self._scrape_one(url, batcher)
+                except (LLMAuthError, LLMRateLimitError):
+                    # 다른 URL도 같은 이유로 실패하므로 순회를 중단 (완료분은 체크포인트에 남음)
+                    raise
+                except Exception as e:
+                    logger.info(f"❌ URL 스크래핑 실패 {url}: {str(e)}")
+                    return url, None
+
+            # 최대 max_concurrency개의 task만 유지 (하나가 끝나면 다음 URL 시작)
+            # URL 수만큼 task를 한 번에 만들지 않아 URL이 많아도 메모리가 늘지 않음
+            url_iter = iter(pending_urls)
+            in_flight: Set[asyncio.Task] = set()
+
+            def fill_in_flight() -> None:
+                for url in itertools.islice(
+                    url_iter, self.config.max_concurrency - len(in_flight)
+                ):
+                    in_flight.add(asyncio.create_task(scrape_with_limit(url)))
+
+            # 진행 상황 카운터 (완료된 URL의 시술 수만 누적하여 매번 전체를 다시 세지 않음)
+            finished_count = 0
+            treatment_count = 0
+            # 완료되었지만 아직 결과를 넘기지 않은 task (중단 시 함께 정리)
+            unreported: List[asyncio.Task] = []
+            try:
+                fill_in_flight()
+                while in_flight:
+                    done, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    # 결과를 넘기기 전에 빈 자리를 먼저 채워 소비자 처리 중에도 스크래핑 진행
+                    fill_in_flight()
+                    unreported = list(done)
+                    while unreported:
+                        url, products = unreported.pop().result()
+                        finished_count += 1
+                        # 실패한 URL은 체크포인트에 기록하지 않아 재실행 시 다시 시도
+                        if products is None:
+                            continue
+                        treatment_count += sum(
+                            len(product.treatments) for product in products
+                        )
+                        logger.info(
+                            f"📊 진행: {finished_count}/{len(pending_urls)} URL, 누적 시술 {treatment_count}개"
+                        )
+                        done_urls.add(url)
+                        checkpoint.mark_done(url, products)
+                        yield url, products
+            finally:
+                # 소비자가 중간에 순회를 멈췄거나 치명적 오류가 난 경우 남은 작업 취소
+                for task in in_flight:
+                    task.cancel()
+                # 배처를 닫기 전에 종료를 기다리고 예외를 회수 (미처리 예외 경고 방지)
+                await asyncio.gather(*in_flight, *unreported, return_exceptions=True)
+
+        # 모든 URL을 처리했으면 체크포인트 삭제
+        if all(url in done_urls for url in urls):
+            checkpoint.clear()
+
+    async def _scrape_one(self, url: str, batcher: LLMBatcher) -> List[ProductItem]:
+        """단일 URL 스크래핑 (LLM 추출은 배처가 다른 URL과 묶어서 수행)"""
+        logger.info(f"📄 스크래핑 중: {url}")
+        products = await batcher.extract(url)
+        logger.info(f"✅ {url}: {len(products)}개 상품 추출")
+        return products
+
+    def _checkpoint_path(self) -> str:
+        """사이트별 체크포인트 파일 경로"""
+        if self.config.checkpoint_path:
+            return self.config.checkpoint_path
+        site_name = self.config.site_name.lower().replace(" ", "_")
+        return f".checkpoints/{site_name}.jsonl"
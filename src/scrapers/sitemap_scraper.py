@@ -4,74 +4,292 @@ Claude/Gemini 지원
 """
 
 import asyncio
+import heapq
+import re
+import time
 import aiohttp
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
-from tqdm import tqdm
+from lxml import etree
 
 from src.models.schemas import ProductItem, ScrapingConfig
+from src.utils.http import get_session
+from src.utils.keyword_matcher import KeywordMatcher, KeywordScorer
+from src.utils.llm_batcher import LLMBatcher
 from src.utils.llm_extractor import LLMTreatmentExtractor
+from src.utils.llm_providers import LLMAuthError, LLMRateLimitError
+from src.utils.log import get_logger
+from src.utils.rate_limiter import host_concurrency_limiter
+from src.utils.scrape_cache import make_cache_key
+from src.utils.url_utils import canonicalize_url, parse_url
+
+logger = get_logger(__name__)
+
+# sitemap 응답 본문 최대 크기 (sitemap 프로토콜 권장 상한 50MB보다 작게 제한)
+SITEMAP_MAX_BYTES = 10 * 1024 * 1024
+
+# sitemap에서 스크래핑 후보로 사용할 최대 URL 수
+SITEMAP_MAX_URLS = 100
+
+# sitemap 요청 타임아웃 (전체 30초, 청크 사이 대기 10초로 느린 응답이 연결을 오래 잡지 않도록 함)
+SITEMAP_TIMEOUT = aiohttp.ClientTimeout(total=30, sock_read=10)
+
+# sitemap 응답을 증분 파싱할 때 한 번에 읽는 크기
+SITEMAP_CHUNK_SIZE = 64 * 1024
+
+# 파싱된 sitemap URL 목록 유지 시간 기본값 (48시간)
+DEFAULT_SITEMAP_MAX_AGE = 48 * 3600
+
+# (base_url, 필터 설정 해시) → (만료 시각, 필터/정렬된 URL 목록)
+_sitemap_url_cache: Dict[Tuple[str, str], Tuple[float, List[str]]] = {}
+
+
+def _sitemap_cache_key(config: ScrapingConfig) -> Tuple[str, str]:
+    """캐시 키 (같은 호스트라도 제외 패턴/우선순위 키워드가 다르면 결과가 다르므로 함께 사용)"""
+    custom_settings = config.custom_settings or {}
+    filter_settings = [
+        sorted(keyword.lower() for keyword in custom_settings.get(name, []))
+        for name in ("exclude_patterns", "priority_keywords")
+    ]
+    return config.base_url, make_cache_key(*filter_settings)
+
+
+def get_cached_sitemap_urls(config: ScrapingConfig) -> Optional[List[str]]:
+    """설정에 맞게 필터링된 캐시 sitemap URL 목록 반환 (없거나 만료되었으면 None)"""
+    cache_key = _sitemap_cache_key(config)
+    entry = _sitemap_url_cache.get(cache_key)
+    if entry is None:
+        return None
+    expires_at, urls = entry
+    if expires_at < time.monotonic():
+        del _sitemap_url_cache[cache_key]
+        return None
+    return urls
+
+
+# 세니아 클리닉 개별 상품 페이지 패턴 (UUID)
+_XENIA_PRODUCT_URL_RE = re.compile(r"xenia\.clinic/ko/products/[a-f0-9-]{36}")
+
+# 제외할 URL 패턴들 (URL당 한 번의 스캔으로 검사)
+_EXCLUDED_URL_PATTERNS = KeywordMatcher(
+    [
+        "/blog/",
+        "/news/",
+        "/notice/",
+        "/event/",
+        "/category/",
+        "/tag/",
+        "/author/",
+        "/feed/",
+        "/rss/",
+        "/atom/",
+        "/admin/",
+        "/login/",
+        "/api/",
+    ]
+)
+
+# 제외할 파일 확장자 (경로 마지막 세그먼트의 확장자로 한 번에 검사)
+_EXCLUDED_EXTENSIONS = frozenset(
+    {"pdf", "jpg", "jpeg", "png", "gif", "webp", "svg", "css", "js"}
+)
+
+# 시술 관련 키워드
+_RELEVANT_URL_KEYWORDS = KeywordMatcher(
+    [
+        "treatment",
+        "service",
+        "procedure",
+        "menu",
+        "price",
+        "cost",
+        "reservation",
+        "booking",
+        "consultation",
+        "products",
+        "시술",
+        "치료",
+        "서비스",
+        "메뉴",
+        "가격",
+        "요금",
+        "예약",
+        "상담",
+        "프로그램",
+        "진료",
+    ]
+)
+
+# URL 우선순위 계산용 키워드 그룹별 가중치 (일치한 키워드마다 가산)
+_PRIORITY_KEYWORD_GROUPS = (
+    # 시술 관련 키워드
+    (("treatment", "procedure", "service", "시술", "치료"), 15),
+    # 제품/메뉴 관련 키워드
+    (("products", "menu", "price", "제품", "메뉴", "가격"), 10),
+    # 예약 관련 키워드
+    (("reservation", "booking", "consultation", "예약", "상담"), 8),
+)
+
+# 설정의 priority_keywords 가중치
+_CUSTOM_PRIORITY_WEIGHT = 20
+
+
+def _path_extension(url: str) -> str:
+    """URL 경로의 파일 확장자 (없으면 빈 문자열)"""
+    last_segment = parse_url(url).path.rpartition("/")[2]
+    return last_segment.rpartition(".")[2] if "." in last_segment else ""
+
+
+def _new_sitemap_parser() -> etree.XMLPullParser:
+    """<url>/<sitemap> 요소가 닫힐 때마다 이벤트를 내는 lxml 증분 파서"""
+    return etree.XMLPullParser(
+        events=("end",),
+        tag=("{*}sitemap", "{*}url"),
+        recover=True,
+        resolve_entities=False,
+    )
+
+
+def _drain_sitemap_events(
+    parser: etree.XMLPullParser, sitemap_locs: List[str], page_locs: List[str]
+) -> None:
+    """파싱이 끝난 요소의 <loc>를 (하위 sitemap / 페이지 URL)로 분류하고 요소 해제"""
+    for _, elem in parser.read_events():
+        loc = (elem.findtext("{*}loc") or "").strip()
+        if loc:
+            if etree.QName(elem).localname == "sitemap":
+                sitemap_locs.append(loc)
+            else:
+                page_locs.append(loc)
+
+        # 처리한 요소와 앞선 형제 요소를 해제하여 트리가 커지지 않도록 함
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
 
 
 class SitemapScraper:
     """Sitemap 기반 URL 수집 및 스크래핑을 담당하는 클래스 (Claude/Gemini 지원)"""
 
-    def __init__(self, config: ScrapingConfig, llm_extractor: LLMTreatmentExtractor):
+    def __init__(
+        self,
+        config: ScrapingConfig,
+        llm_extractor: LLMTreatmentExtractor,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
         self.config = config
         self.llm_extractor = llm_extractor
+        self.session = session
+
+        # 사이트별 제외 패턴/우선순위 키워드를 URL당 한 번의 스캔으로 검사하도록 미리 구성
+        custom_settings = config.custom_settings or {}
+        # URL은 분류 시 한 번만 소문자로 변환하므로 키워드도 생성 시점에 한 번 소문자로 맞춤
+        self._exclude_patterns = KeywordMatcher(
+            keyword.lower() for keyword in custom_settings.get("exclude_patterns", [])
+        )
+        self._priority_keywords = KeywordMatcher(
+            keyword.lower() for keyword in custom_settings.get("priority_keywords", [])
+        )
+
+        # 우선순위 키워드 그룹과 설정 키워드를 합쳐 URL당 한 번의 스캔으로 점수 계산
+        keyword_weights: Dict[str, int] = {}
+        for keywords, weight in (
+            *_PRIORITY_KEYWORD_GROUPS,
+            (self._priority_keywords.keywords, _CUSTOM_PRIORITY_WEIGHT),
+        ):
+            for keyword in keywords:
+                keyword_weights[keyword] = keyword_weights.get(keyword, 0) + weight
+        self._priority_scorer = KeywordScorer(keyword_weights)
+
+        # 이번 수집에서 이미 받은 sitemap (index가 같은 하위 sitemap을 여러 번 참조해도 한 번만 요청)
+        self._sitemap_seen: Set[str] = set()
 
     async def scrape_sitemap_content(self) -> List[ProductItem]:
         """Sitemap 기반 스크래핑 수행"""
-        print(f"🗺️  Sitemap 스크래핑 시작: {self.config.base_url}")
+        logger.info(f"🗺️  Sitemap 스크래핑 시작: {self.config.base_url}")
 
-        # HTTP 세션 생성
-        async with aiohttp.ClientSession() as session:
-            # Sitemap에서 URL들 수집
-            urls = await self._get_sitemap_urls(session, self.config.base_url)
+        # 주입된 세션 또는 공유 HTTP 세션 사용 (커넥션 풀/DNS 캐시를 모든 요청에서 재사용)
+        session = self.session or await get_session()
 
-            if not urls:
-                print("⚠️  Sitemap에서 유효한 URL을 찾을 수 없습니다")
+        # Sitemap에서 URL들 수집 (유효한 캐시가 있으면 네트워크 요청/파싱 생략)
+        urls = get_cached_sitemap_urls(self.config)
+        if urls is None:
+            urls = await self._get_sitemap_urls(session, self.config.base_url)
+            if urls:
+                max_age = self.config.custom_settings.get(
+                    "sitemap_max_age", DEFAULT_SITEMAP_MAX_AGE
+                )
+                _sitemap_url_cache[_sitemap_cache_key(self.config)] = (
+                    time.monotonic() + max_age,
+                    urls,
+                )
+        else:
+            logger.info(f"💾 캐시된 sitemap URL 사용: {len(urls)}개")
+
+        if not urls:
+            logger.info("⚠️  Sitemap에서 유효한 URL을 찾을 수 없습니다")
+            return []
+
+        logger.info(f"📄 Sitemap에서 {len(urls)}개 URL 발견")
+
+        async def scrape_single_url(url: str, batcher: LLMBatcher) -> List[ProductItem]:
+            """단일 URL 스크래핑 (LLM 추출은 배처가 다른 URL과 묶어서 수행)"""
+            try:
+                logger.info(f"📄 스크래핑 중: {url}")
+                async with host_concurrency_limiter.limit(
+                    url, self.config.max_concurrency_per_host
+                ):
+                    products = await batcher.extract(url)
+                logger.info(f"✅ {url}: {len(products)}개 상품 추출")
+                return products
+            except (LLMAuthError, LLMRateLimitError):
+                # 다른 URL도 같은 이유로 실패하므로 TaskGroup 전체를 중단시킴
+                raise
+            except Exception as e:
+                logger.info(f"❌ URL 스크래핑 실패 {url}: {str(e)}")
                 return []
 
-            print(f"📄 Sitemap에서 {len(urls)}개 URL 발견")
-
-            # URL들을 병렬로 스크래핑
-            all_products = []
-
-            async def scrape_single_url(url: str) -> List[ProductItem]:
-                """단일 URL 스크래핑"""
-                try:
-                    tqdm.write(f"📄 스크래핑 중: {url}")
-                    products = await self.llm_extractor.extract_treatments_from_url(url)
-                    tqdm.write(f"✅ {url}: {len(products)}개 상품 추출")
-                    return products
-                except Exception as e:
-                    tqdm.write(f"❌ URL 스크래핑 실패 {url}: {str(e)}")
-                    return []
-
-            # 최대 50개 URL로 제한하여 병렬 처리
-            limited_urls = urls[:50]
-            print(f"🚀 {len(limited_urls)}개 URL 병렬 스크래핑 시작...")
+        # 최대 50개 URL로 제한하여 병렬 처리
+        limited_urls = urls[:50]
+        logger.info(f"🚀 {len(limited_urls)}개 URL 병렬 스크래핑 시작...")
 
-            tasks = [scrape_single_url(url) for url in limited_urls]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 우선순위 순서로 URL을 나눠 가지는 워커들 (하나가 끝나면 바로 다음 URL 시작)
+        results: List[List[ProductItem]] = [[] for _ in limited_urls]
+        pending_urls = iter(enumerate(limited_urls))
 
-            # 결과 수집
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    tqdm.write(f"❌ URL {limited_urls[i]} 처리 중 예외: {str(result)}")
-                else:
-                    all_products.extend(result)
+        async def worker(batcher: LLMBatcher) -> None:
+            for index, url in pending_urls:
+                results[index] = await scrape_single_url(url, batcher)
 
-            print(f"🎉 Sitemap 스크래핑 완료: 총 {len(all_products)}개 상품 수집")
-            return all_products
+        try:
+            async with LLMBatcher(
+                self.llm_extractor,
+                max_batch=self.config.llm_batch_size,
+                # JavaScript가 필요 없는 사이트는 브라우저 없이 정적 HTML 사용
+                render_js=self.config.use_selenium,
+            ) as batcher:
+                # 동시에 렌더링/추출하는 URL 수 제한 (브라우저 과다 실행 방지)
+                async with asyncio.TaskGroup() as task_group:
+                    for _ in range(min(self.config.max_concurrency, len(limited_urls))):
+                        task_group.create_task(worker(batcher))
+        except* (LLMAuthError, LLMRateLimitError) as error_group:
+            # 첫 치명적 LLM 오류에서 남은 URL을 취소하고 이미 추출한 결과만 사용
+            logger.info(
+                f"🛑 LLM 오류로 남은 URL 스크래핑 중단: {error_group.exceptions[0]}"
+            )
+
+        # 결과 수집 (우선순위 순서 유지)
+        all_products = [product for products in results for product in products]
+
+        logger.info(f"🎉 Sitemap 스크래핑 완료: 총 {len(all_products)}개 상품 수집")
+        return all_products
 
     async def _get_sitemap_urls(
         self, session: aiohttp.ClientSession, base_url: str
     ) -> List[str]:
         """sitemap.xml에서 URL들을 추출"""
-        sitemap_urls = []
+        self._sitemap_seen.clear()
+        url_priorities: Dict[str, int] = {}
         potential_sitemaps = [
             "/sitemap.xml",
             "/sitemap_index.xml",
@@ -81,190 +299,189 @@ class SitemapScraper:
             "/sitemap-index.xml",
         ]
 
-        for sitemap_path in potential_sitemaps:
-            sitemap_url = urljoin(base_url, sitemap_path)
-            try:
-                async with session.get(sitemap_url) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        parsed_urls = await self._parse_sitemap_content(
-                            session, content, base_url
-                        )
-                        sitemap_urls.extend(parsed_urls)
-                        tqdm.write(
-                            f"📄 Sitemap 발견: {sitemap_url} ({len(parsed_urls)}개 URL)"
-                        )
-                        break  # 첫 번째로 발견된 sitemap만 사용
-            except Exception as e:
-                tqdm.write(f"⚠️  Sitemap 접근 실패 {sitemap_url}: {str(e)}")
-                continue  # 다음 sitemap 경로 시도
+        async def probe_sitemap(sitemap_url: str) -> bool:
+            """후보 sitemap 경로 존재 여부 확인 (본문은 받지 않음)"""
+            async with session.head(
+                sitemap_url, allow_redirects=True, timeout=SITEMAP_TIMEOUT
+            ) as response:
+                if response.status in (405, 501):
+                    # HEAD 미지원 서버: GET 후 본문을 읽지 않고 연결 해제
+                    async with session.get(
+                        sitemap_url, timeout=SITEMAP_TIMEOUT
+                    ) as get_response:
+                        return get_response.status == 200
+                return response.status == 200
+
+        # 후보 경로들을 동시에 확인 (순차 RTT 합 → 최대 RTT)
+        candidate_urls = [urljoin(base_url, path) for path in potential_sitemaps]
+        probe_tasks = [
+            asyncio.create_task(probe_sitemap(url)) for url in candidate_urls
+        ]
+
+        try:
+            # 후보 순서대로 첫 번째로 발견된 sitemap만 사용 (뒤 후보의 응답은 기다리지 않음)
+            for sitemap_url, probe_task in zip(candidate_urls, probe_tasks):
+                try:
+                    found = await probe_task
+                except Exception as e:
+                    logger.info(f"⚠️  Sitemap 접근 실패 {sitemap_url}: {str(e)}")
+                    continue  # 다음 sitemap 경로 시도
+                if not found:
+                    continue
 
-        return sitemap_urls[:100]  # 최대 100개 URL로 제한
+                # 발견된 sitemap 하나만 본문 다운로드
+                try:
+                    parsed_urls = await self._fetch_and_parse(
+                        session, sitemap_url, base_url
+                    )
+                except Exception as e:
+                    logger.info(f"⚠️  Sitemap 접근 실패 {sitemap_url}: {str(e)}")
+                    continue
+                if parsed_urls is None:
+                    continue
+
+                url_priorities = parsed_urls
+                logger.info(
+                    f"📄 Sitemap 발견: {sitemap_url} ({len(parsed_urls)}개 URL)"
+                )
+                break
+        finally:
+            # sitemap을 찾았으면 아직 응답하지 않은 후보 확인 요청 취소
+            for probe_task in probe_tasks:
+                probe_task.cancel()
+
+        # 우선순위 상위 100개 URL만 선택 (전체 정렬 없이 O(N log K), 동점은 sitemap 순서 유지)
+        return heapq.nlargest(
+            SITEMAP_MAX_URLS, url_priorities, key=url_priorities.__getitem__
+        )
+
+    async def _fetch_and_parse(
+        self, session: aiohttp.ClientSession, sitemap_url: str, base_url: str
+    ) -> Optional[Dict[str, int]]:
+        """sitemap을 받아 URL → 우선순위 추출 (200 응답이 아니면 None)"""
+        # 이미 받은 sitemap의 URL은 결과에 합쳐져 있으므로 다시 요청하지 않음 (순환 참조도 차단)
+        sitemap_key = canonicalize_url(sitemap_url)
+        if sitemap_key in self._sitemap_seen:
+            return {}
+        self._sitemap_seen.add(sitemap_key)
+
+        # 본문을 받는 동안만 슬롯 점유 (하위 sitemap 처리 중에는 반납하여 중첩 대기 방지)
+        async with (
+            host_concurrency_limiter.limit(
+                sitemap_url, self.config.max_concurrency_per_host
+            ),
+            session.get(sitemap_url, timeout=SITEMAP_TIMEOUT) as response,
+        ):
+            if response.status != 200:
+                return None
+            sitemap_locs, page_locs = await self._read_sitemap_locs(response)
+
+        return await self._parse_sitemap_content(
+            session, sitemap_locs, page_locs, base_url
+        )
+
+    async def _read_sitemap_locs(
+        self, response: aiohttp.ClientResponse
+    ) -> Tuple[List[str], List[str]]:
+        """응답 본문을 청크 단위로 증분 파싱하여 <loc> 분류 (본문 전체를 문자열로 만들지 않음)"""
+        parser = _new_sitemap_parser()
+        sitemap_locs: List[str] = []  # sitemap index의 하위 sitemap들
+        page_locs: List[str] = []  # 일반 sitemap의 URL들
+
+        read_bytes = 0
+        async for chunk in response.content.iter_chunked(SITEMAP_CHUNK_SIZE):
+            # 인코딩은 XML 선언을 보고 lxml이 직접 처리
+            parser.feed(chunk)
+            _drain_sitemap_events(parser, sitemap_locs, page_locs)
+
+            read_bytes += len(chunk)
+            if read_bytes >= SITEMAP_MAX_BYTES:
+                logger.info(
+                    f"⚠️  Sitemap이 {SITEMAP_MAX_BYTES // (1024 * 1024)}MB를 초과하여 일부만 사용: {response.url}"
+                )
+                break
 
-    async def _parse_sitemap_content(
-        self, session: aiohttp.ClientSession, content: str, base_url: str
-    ) -> List[str]:
-        """sitemap XML 콘텐츠를 파싱하여 URL 추출"""
-        urls = []
         try:
-            soup = BeautifulSoup(content, "xml")
-
-            # sitemap index인 경우 (다른 sitemap들을 참조)
-            sitemap_tags = soup.find_all("sitemap")
-            if sitemap_tags:
-                for sitemap_tag in sitemap_tags:
-                    loc_tag = sitemap_tag.find("loc")
-                    if loc_tag and loc_tag.text:
-                        # 개별 sitemap을 추가로 파싱
-                        try:
-                            async with session.get(loc_tag.text) as response:
-                                if response.status == 200:
-                                    sub_content = await response.text()
-                                    sub_urls = await self._parse_sitemap_content(
-                                        session, sub_content, base_url
-                                    )
-                                    urls.extend(sub_urls)
-                        except Exception:
-                            continue
+            parser.close()
+        except etree.XMLSyntaxError:
+            pass  # 빈 문서 등 (이미 읽은 <loc>는 그대로 사용)
+        _drain_sitemap_events(parser, sitemap_locs, page_locs)
 
-            # 일반 sitemap인 경우 (URL들을 직접 포함)
-            url_tags = soup.find_all("url")
-            for url_tag in url_tags:
-                loc_tag = url_tag.find("loc")
-                if loc_tag and loc_tag.text:
-                    url = loc_tag.text.strip()
+        return sitemap_locs, page_locs
 
-                    # URL 필터링 및 우선순위 판단
-                    if self._is_sitemap_url_relevant(url):
-                        urls.append(url)
+    async def _parse_sitemap_content(
+        self,
+        session: aiohttp.ClientSession,
+        sitemap_locs: List[str],
+        page_locs: List[str],
+        base_url: str,
+    ) -> Dict[str, int]:
+        """sitemap의 <loc> 목록에서 URL → 우선순위 추출 (중복 URL은 한 번만 분류)"""
+        urls: Dict[str, int] = {}
+        try:
+            # sitemap index인 경우 하위 sitemap들을 동시에 받아 파싱 (순차 RTT 합 → 최대 RTT)
+            # 호스트별 동시 요청 수는 _fetch_and_parse의 limiter가 제한
+            sub_results = await asyncio.gather(
+                *(
+                    self._fetch_and_parse(session, sitemap_loc, base_url)
+                    for sitemap_loc in sitemap_locs
+                ),
+                return_exceptions=True,
+            )
+            # index에 나열된 순서대로 병합 (실패한 하위 sitemap은 건너뜀)
+            for sub_urls in sub_results:
+                if isinstance(sub_urls, dict):
+                    urls.update(sub_urls)
 
-            # 우선순위가 높은 URL들을 앞으로 정렬
-            urls.sort(key=lambda url: self._get_sitemap_url_priority(url), reverse=True)
+            # 일반 sitemap인 경우 (URL들을 직접 포함)
+            for url in page_locs:
+                if url in urls:
+                    continue
+                # URL 필터링 및 우선순위 판단 (URL당 한 번의 분류)
+                priority = self._classify_sitemap_url(url)
+                if priority is not None:
+                    urls[url] = priority
 
         except Exception as e:
-            tqdm.write(f"⚠️ Sitemap 파싱 오류: {str(e)}")
+            logger.info(f"⚠️ Sitemap 파싱 오류: {str(e)}")
 
         return urls
 
-    def _is_sitemap_url_relevant(self, url: str) -> bool:
-        """sitemap URL이 시술 관련 페이지인지 판단"""
+    def _classify_sitemap_url(self, url: str) -> Optional[int]:
+        """sitemap URL의 관련성 판단과 우선순위 계산을 한 번에 수행 (관련 없으면 None)"""
         url_lower = url.lower()
 
         # 설정에서 exclude_patterns 확인
-        if hasattr(self.config, "custom_settings") and self.config.custom_settings:
-            exclude_patterns = self.config.custom_settings.get("exclude_patterns", [])
-            for pattern in exclude_patterns:
-                if pattern in url_lower:
-                    return False
-
-        # 세니아 클리닉의 개별 상품 페이지 패턴 우선 체크
-        import re
-
-        if re.match(r".*xenia\.clinic/ko/products/[a-f0-9-]{36}.*", url_lower):
-            return True
-
-        # 제외할 URL 패턴들
-        excluded_patterns = [
-            "/blog/",
-            "/news/",
-            "/notice/",
-            "/event/",
-            "/category/",
-            "/tag/",
-            "/author/",
-            "/feed/",
-            "/rss/",
-            "/atom/",
-            ".pdf",
-            ".jpg",
-            ".png",
-            ".gif",
-            ".css",
-            ".js",
-            "/admin/",
-            "/login/",
-            "/api/",
-        ]
-
-        for pattern in excluded_patterns:
-            if pattern in url_lower:
-                return False
-
-        # 설정에서 priority_keywords 확인
-        if hasattr(self.config, "custom_settings") and self.config.custom_settings:
-            priority_keywords = self.config.custom_settings.get("priority_keywords", [])
-            for keyword in priority_keywords:
-                if keyword in url_lower:
-                    return True
-
-        # 시술 관련 키워드가 있으면 포함
-        relevant_keywords = [
-            "treatment",
-            "service",
-            "procedure",
-            "menu",
-            "price",
-            "cost",
-            "reservation",
-            "booking",
-            "consultation",
-            "products",
-            "시술",
-            "치료",
-            "서비스",
-            "메뉴",
-            "가격",
-            "요금",
-            "예약",
-            "상담",
-            "프로그램",
-            "진료",
-        ]
+        if self._exclude_patterns.contains_any(url_lower):
+            return None
+
+        # 세니아 클리닉의 개별 상품 페이지 패턴 우선 체크 (UUID 패턴)
+        is_xenia_product = _XENIA_PRODUCT_URL_RE.search(url_lower) is not None
+        if not is_xenia_product:
+            # 제외할 파일 확장자/URL 패턴들
+            if _path_extension(url_lower) in _EXCLUDED_EXTENSIONS:
+                return None
+            if _EXCLUDED_URL_PATTERNS.contains_any(url_lower):
+                return None
+
+            # 설정의 priority_keywords 또는 시술 관련 키워드가 있어야 포함
+            if not (
+                self._priority_keywords.contains_any(url_lower)
+                or _RELEVANT_URL_KEYWORDS.contains_any(url_lower)
+            ):
+                return None
 
-        for keyword in relevant_keywords:
-            if keyword in url_lower:
-                return True
-
-        return False
-
-    def _get_sitemap_url_priority(self, url: str) -> int:
-        """sitemap URL의 우선순위 계산"""
-        url_lower = url.lower()
         priority = 0
 
-        # 세니아 클리닉 개별 상품 페이지 (UUID 패턴)
-        import re
-
-        if re.match(r".*xenia\.clinic/ko/products/[a-f0-9-]{36}.*", url_lower):
+        # 세니아 클리닉 개별 상품 페이지
+        if is_xenia_product:
             priority += 50  # 매우 높은 우선순위
 
-        # 설정의 priority_keywords 확인
-        if hasattr(self.config, "custom_settings") and self.config.custom_settings:
-            priority_keywords = self.config.custom_settings.get("priority_keywords", [])
-            for keyword in priority_keywords:
-                if keyword in url_lower:
-                    priority += 20
-
-        # 시술 관련 키워드
-        treatment_keywords = ["treatment", "procedure", "service", "시술", "치료"]
-        for keyword in treatment_keywords:
-            if keyword in url_lower:
-                priority += 15
-
-        # 제품/메뉴 관련 키워드
-        product_keywords = ["products", "menu", "price", "제품", "메뉴", "가격"]
-        for keyword in product_keywords:
-            if keyword in url_lower:
-                priority += 10
-
-        # 예약 관련 키워드
-        booking_keywords = ["reservation", "booking", "consultation", "예약", "상담"]
-        for keyword in booking_keywords:
-            if keyword in url_lower:
-                priority += 8
+        # 설정의 priority_keywords와 시술/제품/예약 키워드 가중치 합
+        priority += self._priority_scorer.score(url_lower)
 
         # 메인 페이지는 낮은 우선순위
-        if url_lower.endswith("/") or url_lower.endswith("/index.html"):
+        if url_lower.endswith(("/", "/index.html")):
             priority -= 5
 
         return priority
@@ -4,9 +4,15 @@ Claude/Gemini 지원
 """
 
 import asyncio
+import os
+import random
 import time
-from typing import List, Dict, Set, Any
-from playwright.async_api import async_playwright, Page
+import unicodedata
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, List, Dict, Optional, Set, Any, Tuple
+
+import orjson
 
 from src.models.schemas import (
     ProductItem,
@@ -14,6 +20,151 @@ from src.models.schemas import (
 )
 from src.models.schemas import ScrapingResult
 from src.utils.llm_extractor import LLMTreatmentExtractor
+from src.utils.log import get_logger
+from src.utils.rate_limiter import domain_rate_limiter
+from src.utils.scrape_cache import DEFAULT_CACHE_TTL, ScrapeCache, make_cache_key
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+logger = get_logger(__name__)
+
+# 요소들의 표시/활성 상태와 서명(태그:텍스트:클래스:ID:href:data 속성)을 한 번에 계산
+_ELEMENT_INFOS_JS = """elements => elements.map(el => {
+    const rect = el.getBoundingClientRect();
+    const dataAttrs = [];
+    for (const attr of el.attributes) {
+        if (attr.name.startsWith('data-')) {
+            dataAttrs.push(`${attr.name}=${attr.value}`);
+        }
+    }
+    const text = (el.textContent || '').trim().slice(0, 50);
+    return {
+        visible: rect.width > 0 && rect.height > 0
+            && getComputedStyle(el).visibility !== 'hidden',
+        enabled: !el.matches(':disabled'),
+        signature: [
+            el.tagName.toLowerCase(),
+            text,
+            el.getAttribute('class') || '',
+            el.getAttribute('id') || '',
+            el.getAttribute('href') || '',
+            dataAttrs.sort().join('|'),
+        ].join(':'),
+    };
+})"""
+
+# 클릭할 요소의 로그용 정보(텍스트/태그/클래스/ID/href/data 속성)를 한 번에 조회
+_ELEMENT_DETAILS_JS = """el => {
+    const data = {};
+    for (const attr of el.attributes) {
+        if (attr.name.startsWith('data-')) {
+            data[attr.name] = attr.value;
+        }
+    }
+    return {
+        text: el.textContent || '',
+        tag: el.tagName.toLowerCase(),
+        class: el.getAttribute('class') || '',
+        id: el.getAttribute('id') || '',
+        href: el.getAttribute('href') || '',
+        data,
+    };
+}"""
+
+# 현재 화면 상태 서명 (요소 수:보이는 텍스트 길이:텍스트 FNV-1a 해시)
+# 전체 HTML을 CDP로 직렬화하지 않고 짧은 문자열만 받아 중복 상태를 판단
+_CONTENT_SIGNATURE_JS = """() => {
+    const text = document.body ? document.body.innerText : '';
+    let hash = 0x811c9dc5;
+    for (let i = 0; i < text.length; i++) {
+        hash ^= text.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193);
+    }
+    const count = document.getElementsByTagName('*').length;
+    return `${count}:${text.length}:${(hash >>> 0).toString(16)}`;
+}"""
+
+# 상호작용 후보 선택자 (우선순위 순, 메뉴/네비게이션 요소 우선)
+INTERACTION_SELECTORS = (
+    # 최고 우선순위: 데이터 속성 기반 메뉴
+    "[data-target]",  # 데이터 타겟 속성 (일반적인 메뉴 패턴)
+    "[data-toggle]",  # 데이터 토글 속성
+    "[data-category]",  # 데이터 카테고리 속성
+    # 높은 우선순위: 메뉴/카테고리 클래스 (사용자 요청 반영)
+    ".mainCateBox a",  # 메인 카테고리 (사용자 예시 기반)
+    ".subCateBox a",  # 서브 카테고리 (사용자 예시 기반)
+    ".category a",  # 일반 카테고리
+    ".menu-item a",  # 메뉴 아이템
+    ".nav-item a",  # 네비게이션 아이템
+    # 중간 우선순위: 슬라이더/탭 네비게이션
+    ".swiper-slide a",  # 스와이퍼 슬라이드 내 링크
+    ".tabs li a",  # 탭 메뉴
+    ".tab-list a",  # 탭 리스트
+    '[role="tab"]',  # ARIA 탭
+    '[role="menuitem"]',  # ARIA 메뉴 아이템
+    # 낮은 우선순위: 카테고리/메뉴 버튼
+    ".btn-category",  # 카테고리 버튼
+    ".btn-menu",  # 메뉴 버튼
+    'button[class*="category"]',  # 카테고리가 포함된 버튼
+    'button[class*="menu"]',  # 메뉴가 포함된 버튼
+    # 기존 더보기/페이지네이션 (낮은 우선순위)
+    # 더보기 버튼/링크는 Playwright 텍스트 선택자 하나로 조회 (CSS에는 텍스트 선택자가 없음)
+    'button:has-text("더보기"), button:has-text("더 보기"), a:has-text("더보기"), a:has-text("더 보기")',
+    ".load-more",
+    ".btn-more",
+    ".more-button",
+    '[data-action="load-more"]',
+    # 페이지네이션
+    ".pagination .next",
+    ".pagination a:last-child",
+    ".page-next",
+    'a:has-text("다음")',
+    # 최저 우선순위: 일반 링크/버튼
+    'a[href]:not([href="#"]):not([href="javascript:void(0)"])',  # 유효한 링크
+    "button:not([disabled])",  # 활성화된 버튼
+)
+
+# 현재 DOM 크기 (클릭 전후 비교로 화면 변화 감지)
+_DOM_LENGTH_JS = "() => document.body ? document.body.innerHTML.length : 0"
+
+# 페이지 대기 제한 시간 (고정 대기 대신 조건이 충족되면 바로 진행)
+INITIAL_LOAD_TIMEOUT_MS = 5000  # 첫 로드 후 networkidle 대기
+SETTLE_TIMEOUT_MS = 2000  # 상호작용/스크롤 후 networkidle 대기
+DOM_CHANGE_TIMEOUT_MS = 3000  # 클릭 후 DOM 변화 대기
+DOM_CHANGE_POLL_MS = 100
+
+
+async def _wait_for_network_idle(page: "Page", timeout: int) -> None:
+    """네트워크 요청이 잦아들 때까지 대기 (폴링 등으로 계속 요청이 있으면 제한 시간 후 진행)"""
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+    except Exception:
+        pass
+
+
+# 상호작용별 디버그 HTML 저장 위치와 저장할 HTML 길이
+DEBUG_HTML_DIR = "log/errors"
+DEBUG_HTML_SAMPLE_LENGTH = 5000
+
+
+def _write_debug_html(interaction_num: int, html_content: str) -> None:
+    """상호작용 스냅샷의 HTML 샘플을 디버그 파일로 저장"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+    debug_filename = (
+        f"{DEBUG_HTML_DIR}/html_debug_interaction_{interaction_num}_{timestamp}.txt"
+    )
+    with open(debug_filename, "w", encoding="utf-8") as f:
+        f.write(f"=== Interaction {interaction_num} Debug ===\n")
+        f.write(f"HTML 크기: {len(html_content)} 문자\n")
+        f.write(f"시간: {datetime.now().isoformat()}\n")
+        f.write("=" * 50 + "\n\n")
+        f.write(f"HTML 샘플 (처음 {DEBUG_HTML_SAMPLE_LENGTH}자):\n")
+        f.write(html_content[:DEBUG_HTML_SAMPLE_LENGTH])
+
+
+# 스냅샷 LLM 추출 동시 실행 수 (클릭과 겹쳐 실행되므로 API rate limit을 넘지 않도록 제한)
+SNAPSHOT_LLM_CONCURRENCY = 4
 
 
 class SPAContentScraper:
@@ -29,293 +180,295 @@ class SPAContentScraper:
         if not self.spa_config:
             raise ValueError("SPA config is required for SPA scraping")
 
-    async def scrape_spa_content(self, url: str) -> ScrapingResult:
+        # 렌더링된 HTML 스냅샷 캐시 (TTL은 custom_settings["cache_ttl"]로 조정)
+        self.scrape_cache = ScrapeCache(
+            ttl=config.custom_settings.get("cache_ttl", DEFAULT_CACHE_TTL)
+        )
+        self._llm_semaphore = asyncio.Semaphore(SNAPSHOT_LLM_CONCURRENCY)
+
+        # 디버그 HTML 저장 폴더는 한 번만 생성
+        if self.spa_config.debug_html_dump:
+            os.makedirs(DEBUG_HTML_DIR, exist_ok=True)
+
+    async def scrape_spa_content(
+        self, url: str, force_rescrape: bool = False
+    ) -> ScrapingResult:
         """SPA 사이트에서 동적 콘텐츠를 스크래핑"""
         start_time = time.time()
+        # 상호작용 번호 → 수집 직후 시작한 LLM 추출 task
+        extraction_tasks: Dict[int, asyncio.Task] = {}
 
-        async with async_playwright() as p:
-            # 브라우저 실행
-            browser = await p.chromium.launch(
-                headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"]
+        def start_extraction(interaction_num: int, html_content: str) -> None:
+            """스냅샷 수집 즉시 LLM 추출 시작 (다음 클릭/대기와 겹쳐 실행)"""
+            extraction_tasks[interaction_num] = asyncio.create_task(
+                self._extract_snapshot(url, interaction_num, html_content)
             )
 
-            try:
-                page = await browser.new_page()
-
-                # User-Agent 설정
-                if self.config.headers.get("User-Agent"):
-                    await page.set_extra_http_headers(
-                        {"User-Agent": self.config.headers["User-Agent"]}
-                    )
+        try:
+            # 같은 URL/상호작용 설정의 스냅샷이 캐시에 있으면 브라우저 실행 생략
+            cache_key = make_cache_key(
+                url,
+                self.spa_config.click_elements,
+                self.spa_config.wait_time,
+                self.spa_config.max_interactions,
+            )
+            cached = None if force_rescrape else self.scrape_cache.get(cache_key)
+
+            if cached:
+                logger.info(f"💾 캐시된 HTML 스냅샷 사용: {url}")
+                collected_htmls = [tuple(item) for item in cached["htmls"]]
+                content_states = cached["content_states"]
+                interactions_performed = cached["interactions_performed"]
+            else:
+                (
+                    collected_htmls,
+                    content_states,
+                    interactions_performed,
+                ) = await self._collect_htmls(url, on_snapshot=start_extraction)
+                self.scrape_cache.set(
+                    cache_key,
+                    {
+                        "htmls": collected_htmls,
+                        "content_states": content_states,
+                        "interactions_performed": interactions_performed,
+                    },
+                )
 
-                # 초기 페이지 로드
-                print(f"🌐 페이지 로딩: {url}")
-                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                await page.wait_for_timeout(3000)  # 초기 로딩 대기
+            all_products = await self._process_htmls(
+                url, collected_htmls, extraction_tasks
+            )
 
-                content_states = []
-                all_products = []
-                interactions_performed = 0
+            processing_time = time.time() - start_time
 
-                # HTML 수집과 LLM 처리를 분리하여 병렬 처리
-                collected_htmls = []  # (interaction_num, html_content) 저장
+            return ScrapingResult(
+                url=url,
+                products=all_products,
+                interactions_performed=interactions_performed,
+                content_states=content_states,
+                processing_time=processing_time,
+            )
 
-                # 1단계: 브라우저 상호작용으로 HTML들 수집
-                print("📥 1단계: 브라우저 상호작용으로 HTML 수집...")
+        except Exception as e:
+            # 수집 도중 실패하면 이미 시작한 추출 task 정리
+            for task in extraction_tasks.values():
+                task.cancel()
+            processing_time = time.time() - start_time
+            return ScrapingResult(
+                url=url,
+                products=[],
+                interactions_performed=0,
+                content_states=[],
+                error=str(e),
+                processing_time=processing_time,
+            )
 
-                for interaction_num in range(self.spa_config.max_interactions):
-                    print(
-                        f"🔄 상호작용 {interaction_num + 1}/{self.spa_config.max_interactions}"
-                    )
+    async def _collect_htmls(
+        self,
+        url: str,
+        on_snapshot: Optional[Callable[[int, str], None]] = None,
+    ) -> Tuple[List[Tuple[int, str]], List[str], int]:
+        """브라우저 상호작용으로 HTML 스냅샷들을 수집 (on_snapshot은 새 스냅샷마다 호출)"""
+        # 추출기의 브라우저 풀을 재사용하고 URL마다 가벼운 컨텍스트만 생성
+        # (캐시 적중 시에는 브라우저를 실행하지 않음, 이미지/폰트/미디어 요청은 차단)
+        async with self.llm_extractor.browser_pool.context(
+            user_agent=self.config.headers.get("User-Agent")
+        ) as context:
+            page = await context.new_page()
+
+            # 초기 페이지 로드
+            logger.info(f"🌐 페이지 로딩: {url}")
+            await domain_rate_limiter.acquire(url)
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            # 초기 로딩 대기 (고정 대기 대신 네트워크 요청이 잦아들면 바로 진행)
+            await _wait_for_network_idle(page, INITIAL_LOAD_TIMEOUT_MS)
+
+            content_states = []
+            # 중복 체크용 집합 (content_states는 캐시/결과 기록용으로 순서를 유지)
+            seen_states: Set[str] = set()
+            interactions_performed = 0
+
+            # HTML 수집과 LLM 처리를 분리하여 병렬 처리
+            collected_htmls = []  # (interaction_num, html_content) 저장
+
+            # 1단계: 브라우저 상호작용으로 HTML들 수집
+            logger.info("📥 1단계: 브라우저 상호작용으로 HTML 수집...")
+
+            for interaction_num in range(self.spa_config.max_interactions):
+                logger.info(
+                    f"🔄 상호작용 {interaction_num + 1}/{self.spa_config.max_interactions}"
+                )
 
-                    # 현재 콘텐츠 상태 캡처
-                    current_content = await page.content()
-                    content_hash = str(hash(current_content))
+                # 현재 콘텐츠 상태 서명을 브라우저에서 계산 (HTML 전체 전송 없이 중복 체크)
+                content_hash = await page.evaluate(_CONTENT_SIGNATURE_JS)
 
-                    # 중복 콘텐츠 체크
-                    if content_hash in content_states:
-                        print("⚠️  중복 콘텐츠 감지, 상호작용 중단")
-                        break
+                # 중복 콘텐츠 체크
+                if content_hash in seen_states:
+                    logger.info("⚠️  중복 콘텐츠 감지, 상호작용 중단")
+                    break
 
-                    content_states.append(content_hash)
+                seen_states.add(content_hash)
+                content_states.append(content_hash)
 
-                    # HTML을 수집 목록에 저장 (LLM 처리는 나중에)
-                    collected_htmls.append((interaction_num + 1, current_content))
-                    print(
-                        f"📏 상호작용 {interaction_num + 1} HTML 수집: {len(current_content)} 문자"
-                    )
+                # 새로운 상태일 때만 전체 HTML 직렬화
+                current_content = await page.content()
 
-                    # 다음 상호작용 수행
-                    if interaction_num < self.spa_config.max_interactions - 1:
-                        success = await self._perform_interaction(
-                            page, interaction_num + 2
-                        )
-                        if success:
-                            interactions_performed += 1
-                            # 상호작용 후 콘텐츠 로딩 대기
-                            await page.wait_for_timeout(2000)
-                        else:
-                            print("🔚 더 이상 상호작용할 요소가 없음")
-                            break
-
-                # 2단계: 수집된 모든 HTML을 병렬로 LLM 처리
-                if collected_htmls:
-                    print(f"🚀 2단계: {len(collected_htmls)}개 HTML을 병렬 LLM 처리...")
-
-                    async def process_single_html(
-                        interaction_num: int, html_content: str
-                    ) -> List[ProductItem]:
-                        """단일 HTML을 LLM으로 처리"""
-                        try:
-                            # HTML 디버그 로그 저장
-                            from datetime import datetime
-
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
-                            debug_filename = f"log/errors/html_debug_interaction_{interaction_num}_{timestamp}.txt"
-
-                            import os
-
-                            os.makedirs("log/errors", exist_ok=True)
-                            with open(debug_filename, "w", encoding="utf-8") as f:
-                                f.write(
-                                    f"=== Interaction {interaction_num} Debug ===\n"
-                                )
-                                f.write(f"HTML 크기: {len(html_content)} 문자\n")
-                                f.write(f"시간: {datetime.now().isoformat()}\n")
-                                f.write("=" * 50 + "\n\n")
-                                f.write("HTML 샘플 (처음 5000자):\n")
-                                f.write(html_content[:5000])
-
-                            print(f"🤖 상호작용 {interaction_num} LLM 처리 중...")
-                            products = await self.llm_extractor.extract_treatments_from_html_async(
-                                html_content, url
-                            )
-                            print(
-                                f"✅ 상호작용 {interaction_num}: {len(products)}개 상품 추출 완료"
-                            )
-                            return products
+                # HTML을 수집 목록에 저장하고 다음 상호작용 전에 LLM 처리 시작
+                collected_htmls.append((interaction_num + 1, current_content))
+                if on_snapshot is not None:
+                    on_snapshot(interaction_num + 1, current_content)
+                logger.info(
+                    f"📏 상호작용 {interaction_num + 1} HTML 수집: {len(current_content)} 문자"
+                )
 
-                        except Exception as e:
-                            print(
-                                f"⚠️ 상호작용 {interaction_num} LLM 처리 오류: {str(e)}"
-                            )
-                            return []
+                # 다음 상호작용 수행
+                if interaction_num < self.spa_config.max_interactions - 1:
+                    success = await self._perform_interaction(page, interaction_num + 2)
+                    if success:
+                        interactions_performed += 1
+                        # 상호작용 후 콘텐츠 로딩 대기 (요청이 끝나면 바로 진행)
+                        await _wait_for_network_idle(page, SETTLE_TIMEOUT_MS)
+                    else:
+                        logger.info("🔚 더 이상 상호작용할 요소가 없음")
+                        break
 
-                    # 모든 HTML을 병렬로 LLM 처리 (Promise.all 방식)
-                    tasks = [
-                        process_single_html(num, html) for num, html in collected_htmls
-                    ]
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                    # 결과 수집 및 중복 제거
-                    for i, result in enumerate(results):
-                        interaction_num = collected_htmls[i][0]
-                        if isinstance(result, Exception):
-                            print(
-                                f"❌ 상호작용 {interaction_num} 처리 중 예외: {str(result)}"
-                            )
-                        elif result:
-                            new_products = self._deduplicate_products(
-                                all_products, result
-                            )
-                            all_products.extend(new_products)
-                            print(
-                                f"🔗 상호작용 {interaction_num}: {len(result)}개 추출 → {len(new_products)}개 신규 (총 {len(all_products)}개)"
-                            )
-                        else:
-                            print(f"📭 상호작용 {interaction_num}: 추출된 상품 없음")
+            return collected_htmls, content_states, interactions_performed
 
-                    print(f"🎉 병렬 LLM 처리 완료: 총 {len(all_products)}개 상품 수집")
+    async def _process_htmls(
+        self,
+        url: str,
+        collected_htmls: List[Tuple[int, str]],
+        started_tasks: Optional[Dict[int, asyncio.Task]] = None,
+    ) -> List[ProductItem]:
+        """수집된 HTML들을 병렬로 LLM 처리하고 중복 제거 (이미 시작된 추출은 결과만 대기)"""
+        all_products = []
+        seen_product_keys: Set[str] = set()  # 추가된 제품 이름 키 (결과마다 증분 갱신)
+        if not collected_htmls:
+            return all_products
+
+        # 2단계: 수집된 모든 HTML의 LLM 처리 결과 수집
+        logger.info(f"🚀 2단계: {len(collected_htmls)}개 HTML을 병렬 LLM 처리...")
+
+        # 수집 중 시작되지 않은 HTML(캐시 적중 등)만 새로 처리 (Promise.all 방식)
+        started_tasks = started_tasks or {}
+        tasks = [
+            started_tasks.get(num)
+            or asyncio.create_task(self._extract_snapshot(url, num, html))
+            for num, html in collected_htmls
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # 결과 수집 및 중복 제거
+        for i, result in enumerate(results):
+            interaction_num = collected_htmls[i][0]
+            if isinstance(result, Exception):
+                logger.info(
+                    f"❌ 상호작용 {interaction_num} 처리 중 예외: {str(result)}"
+                )
+            elif result:
+                new_products = self._deduplicate_products(seen_product_keys, result)
+                all_products.extend(new_products)
+                logger.info(
+                    f"🔗 상호작용 {interaction_num}: {len(result)}개 추출 → {len(new_products)}개 신규 (총 {len(all_products)}개)"
+                )
+            else:
+                logger.info(f"📭 상호작용 {interaction_num}: 추출된 상품 없음")
 
-                processing_time = time.time() - start_time
+        logger.info(f"🎉 병렬 LLM 처리 완료: 총 {len(all_products)}개 상품 수집")
+        return all_products
 
-                return ScrapingResult(
-                    url=url,
-                    products=all_products,
-                    interactions_performed=interactions_performed,
-                    content_states=content_states,
-                    processing_time=processing_time,
+    async def _extract_snapshot(
+        self, url: str, interaction_num: int, html_content: str
+    ) -> List[ProductItem]:
+        """단일 HTML을 LLM으로 처리"""
+        try:
+            # HTML 디버그 로그 저장 (설정한 경우만, 파일 쓰기는 스레드에서 수행)
+            if self.spa_config.debug_html_dump:
+                await asyncio.to_thread(
+                    _write_debug_html, interaction_num, html_content
                 )
 
-            except Exception as e:
-                processing_time = time.time() - start_time
-                return ScrapingResult(
-                    url=url,
-                    products=[],
-                    interactions_performed=0,
-                    content_states=[],
-                    error=str(e),
-                    processing_time=processing_time,
+            async with self._llm_semaphore:
+                logger.info(f"🤖 상호작용 {interaction_num} LLM 처리 중...")
+                products = await self.llm_extractor.extract_treatments_from_html_async(
+                    html_content, url
                 )
+            logger.info(
+                f"✅ 상호작용 {interaction_num}: {len(products)}개 상품 추출 완료"
+            )
+            return products
 
-            finally:
-                await browser.close()
+        except Exception as e:
+            logger.info(f"⚠️ 상호작용 {interaction_num} LLM 처리 오류: {str(e)}")
+            return []
 
-    async def _perform_interaction(self, page: Page, interaction_num: int = 0) -> bool:
+    async def _perform_interaction(
+        self, page: "Page", interaction_num: int = 0
+    ) -> bool:
         """페이지에서 상호작용 수행 (메뉴/네비게이션 요소 우선)"""
 
-        # 메뉴/네비게이션 요소 우선 탐지 (일반적인 패턴들)
-        menu_selectors = [
-            # 최고 우선순위: 데이터 속성 기반 메뉴
-            "[data-target]",  # 데이터 타겟 속성 (일반적인 메뉴 패턴)
-            "[data-toggle]",  # 데이터 토글 속성
-            "[data-category]",  # 데이터 카테고리 속성
-            # 높은 우선순위: 메뉴/카테고리 클래스 (사용자 요청 반영)
-            ".mainCateBox a",  # 메인 카테고리 (사용자 예시 기반)
-            ".subCateBox a",  # 서브 카테고리 (사용자 예시 기반)
-            ".category a",  # 일반 카테고리
-            ".menu-item a",  # 메뉴 아이템
-            ".nav-item a",  # 네비게이션 아이템
-            # 중간 우선순위: 슬라이더/탭 네비게이션
-            ".swiper-slide a",  # 스와이퍼 슬라이드 내 링크
-            ".tabs li a",  # 탭 메뉴
-            ".tab-list a",  # 탭 리스트
-            '[role="tab"]',  # ARIA 탭
-            '[role="menuitem"]',  # ARIA 메뉴 아이템
-            # 낮은 우선순위: 카테고리/메뉴 버튼
-            ".btn-category",  # 카테고리 버튼
-            ".btn-menu",  # 메뉴 버튼
-            'button[class*="category"]',  # 카테고리가 포함된 버튼
-            'button[class*="menu"]',  # 메뉴가 포함된 버튼
-            # 기존 더보기/페이지네이션 (낮은 우선순위)
-            'button:contains("더보기")',
-            'button:contains("더 보기")',
-            'a:contains("더보기")',
-            'a:contains("더 보기")',
-            ".load-more",
-            ".btn-more",
-            ".more-button",
-            '[data-action="load-more"]',
-            # 페이지네이션
-            ".pagination .next",
-            ".pagination a:last-child",
-            ".page-next",
-            'a:contains("다음")',
-            # 최저 우선순위: 일반 링크/버튼
-            'a[href]:not([href="#"]):not([href="javascript:void(0)"])',  # 유효한 링크
-            "button:not([disabled])",  # 활성화된 버튼
-        ]
+        # 사이트 설정의 클릭 대상은 하나의 결합 선택자로 가장 먼저 조회
+        menu_selectors = INTERACTION_SELECTORS
+        if self.spa_config.combined_click_selector:
+            menu_selectors = (
+                self.spa_config.combined_click_selector,
+                *INTERACTION_SELECTORS,
+            )
 
         clicked_element = None
 
         # 메뉴 셀렉터들을 우선순위대로 시도
         for selector in menu_selectors:
             try:
-                elements = await page.query_selector_all(selector)
-                # 보이는 요소만 필터링
-                visible_elements = []
-                for element in elements:
-                    try:
-                        is_visible = await element.is_visible()
-                        is_enabled = await element.is_enabled()
-                        if is_visible and is_enabled:
-                            visible_elements.append(element)
-                    except Exception:
-                        continue
+                # 보이고 활성화된 요소와 서명을 한 번의 호출로 조회
+                visible_elements = await self._get_visible_elements(page, selector)
 
                 if visible_elements:
                     # 이미 상호작용한 요소들 제외
-                    available_elements = []
-                    for element in visible_elements:
-                        signature = await self._get_element_signature(element)
-                        if signature not in self.interacted_elements:
-                            available_elements.append(element)
+                    available_elements = [
+                        (element, signature)
+                        for element, signature in visible_elements
+                        if signature not in self.interacted_elements
+                    ]
 
                     if not available_elements:
-                        print(
+                        logger.info(
                             f"   🔄 모든 '{selector}' 요소와 이미 상호작용 완료, 다음 셀렉터 시도..."
                         )
                         continue
 
                     # 사용 가능한 요소 중에서 랜덤 선택
-                    import random
-
-                    clicked_element = random.choice(available_elements)
+                    clicked_element, element_signature = random.choice(
+                        available_elements
+                    )
 
                     try:
-                        # 클릭하기 전에 요소 서명 생성 (추가는 나중에)
-                        element_signature = await self._get_element_signature(
-                            clicked_element
-                        )
-
-                        # 요소 정보 수집
-                        element_text = await clicked_element.text_content()
-                        element_tag = await clicked_element.evaluate(
-                            "el => el.tagName.toLowerCase()"
-                        )
-                        element_class = (
-                            await clicked_element.get_attribute("class") or ""
-                        )
-                        element_id = await clicked_element.get_attribute("id") or ""
-                        element_href = await clicked_element.get_attribute("href") or ""
-                        element_data_attrs = await clicked_element.evaluate("""el => {
-                            const attrs = {};
-                            for (let attr of el.attributes) {
-                                if (attr.name.startsWith('data-')) {
-                                    attrs[attr.name] = attr.value;
-                                }
-                            }
-                            return attrs;
-                        }""")
+                        # 요소 정보를 한 번의 호출로 수집 (속성마다 브라우저 왕복하지 않음)
+                        details = await clicked_element.evaluate(_ELEMENT_DETAILS_JS)
+                        element_text = details["text"]
+                        element_tag = details["tag"]
+                        element_class = details["class"]
+                        element_id = details["id"]
+                        element_href = details["href"]
+                        element_data_attrs = details["data"]
 
                         # 요소 위치 정보
                         bounding_box = await clicked_element.bounding_box()
 
                         # 상세 로깅
-                        print(f"🎯 상호작용 {interaction_num}: 메뉴 요소 클릭")
-                        print(f"   🔍 셀렉터: {selector}")
-                        print(f"   🔑 서명: {element_signature}")
-                        print(f"   📝 텍스트: '{element_text[:50]}...'")
-                        print(f"   🏷️  태그: {element_tag}")
-                        print(f"   🎨 클래스: '{element_class[:50]}...'")
+                        logger.info(f"🎯 상호작용 {interaction_num}: 메뉴 요소 클릭")
+                        logger.info(f"   🔍 셀렉터: {selector}")
+                        logger.info(f"   🔑 서명: {element_signature}")
+                        logger.info(f"   📝 텍스트: '{element_text[:50]}...'")
+                        logger.info(f"   🏷️  태그: {element_tag}")
+                        logger.info(f"   🎨 클래스: '{element_class[:50]}...'")
                         if element_id:
-                            print(f"   🆔 ID: '{element_id}'")
+                            logger.info(f"   🆔 ID: '{element_id}'")
                         if element_href:
-                            print(f"   🔗 링크: '{element_href[:50]}...'")
+                            logger.info(f"   🔗 링크: '{element_href[:50]}...'")
                         if element_data_attrs:
-                            print(f"   📊 데이터 속성: {element_data_attrs}")
+                            logger.info(f"   📊 데이터 속성: {element_data_attrs}")
                         if bounding_box:
-                            print(
+                            logger.info(
                                 f"   📍 위치: ({bounding_box['x']:.1f}, {bounding_box['y']:.1f}) 크기: {bounding_box['width']:.1f}x{bounding_box['height']:.1f}"
                             )
 
@@ -335,12 +488,12 @@ class SPAContentScraper:
                             },
                         )
 
-                        # 부드러운 스크롤 후 클릭
+                        # 스크롤 후 클릭 (click이 요소가 멈출 때까지 기다리므로 별도 대기 없음)
                         await clicked_element.scroll_into_view_if_needed()
-                        await page.wait_for_timeout(500)  # 스크롤 완료 대기
 
-                        # 클릭 전 페이지 URL 기록
+                        # 클릭 전 페이지 URL과 DOM 크기 기록
                         before_url = page.url
+                        before_dom_length = await page.evaluate(_DOM_LENGTH_JS)
 
                         # 여러 클릭 방법 시도
                         click_success = False
@@ -349,12 +502,12 @@ class SPAContentScraper:
                             await clicked_element.click(timeout=5000)
                             click_success = True
                         except Exception as e1:
-                            print(f"   ⚠️ 기본 클릭 실패: {str(e1)[:80]}...")
+                            logger.info(f"   ⚠️ 기본 클릭 실패: {str(e1)[:80]}...")
                             try:
                                 # 방법 2: force 클릭 (가로막는 요소 무시)
                                 await clicked_element.click(force=True, timeout=3000)
                                 click_success = True
-                                print("   ✅ Force 클릭으로 성공")
+                                logger.info("   ✅ Force 클릭으로 성공")
                             except Exception:
                                 try:
                                     # 방법 3: JavaScript 클릭
@@ -362,32 +515,40 @@ class SPAContentScraper:
                                         "element => element.click()"
                                     )
                                     click_success = True
-                                    print("   ✅ JavaScript 클릭으로 성공")
+                                    logger.info("   ✅ JavaScript 클릭으로 성공")
                                 except Exception:
-                                    print("   ❌ 모든 클릭 방법 실패")
+                                    logger.info("   ❌ 모든 클릭 방법 실패")
                                     raise e1  # 원래 에러를 다시 발생시킴
 
                         if not click_success:
                             raise Exception("All click methods failed")
 
-                        # 클릭 후 페이지 변화 대기 및 확인
-                        await page.wait_for_timeout(1500)
+                        # 클릭 후 DOM이 바뀔 때까지만 대기 (변화가 없으면 제한 시간 후 진행)
+                        try:
+                            await page.wait_for_function(
+                                f"length => ({_DOM_LENGTH_JS})() !== length",
+                                arg=before_dom_length,
+                                polling=DOM_CHANGE_POLL_MS,
+                                timeout=DOM_CHANGE_TIMEOUT_MS,
+                            )
+                        except Exception:
+                            pass  # 화면 변화 없이 끝나는 클릭도 있으므로 계속 진행
                         after_url = page.url
 
                         # URL 변화 체크
                         if before_url != after_url:
-                            print(f"   🔀 URL 변화: {before_url} → {after_url}")
+                            logger.info(f"   🔀 URL 변화: {before_url} → {after_url}")
 
                         # 클릭 성공 시에만 interacted_elements에 추가
                         self.interacted_elements.add(element_signature)
-                        print(
+                        logger.info(
                             f"   ✅ 클릭 성공 (총 {len(self.interacted_elements)}개 요소와 상호작용 완료)"
                         )
                         return True
 
                     except Exception as e:
-                        print(f"⚠️ 클릭 실행 오류: {str(e)}")
-                        print(
+                        logger.info(f"⚠️ 클릭 실행 오류: {str(e)}")
+                        logger.info(
                             f"   🔄 요소 '{element_signature[:50]}...'는 다음 상호작용에서 재시도 가능"
                         )
                         # 실패한 상호작용도 로깅 (단, interacted_elements에는 추가하지 않음)
@@ -409,15 +570,22 @@ class SPAContentScraper:
         # 메뉴 요소를 찾지 못한 경우 스크롤 시도
         if not clicked_element:
             try:
-                print(f"📜 상호작용 {interaction_num}: 메뉴 요소 없음, 스크롤 시도...")
+                logger.info(
+                    f"📜 상호작용 {interaction_num}: 메뉴 요소 없음, 스크롤 시도..."
+                )
                 await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await page.wait_for_timeout(1000)
+                # 지연 로딩 요청이 끝날 때까지만 대기
+                await _wait_for_network_idle(page, SETTLE_TIMEOUT_MS)
                 return True
             except Exception:
                 pass
 
-        print(f"⚠️ 상호작용 {interaction_num}: 상호작용 가능한 요소를 찾을 수 없습니다.")
-        print(f"   📋 총 {len(self.interacted_elements)}개 요소와 이미 상호작용 완료")
+        logger.info(
+            f"⚠️ 상호작용 {interaction_num}: 상호작용 가능한 요소를 찾을 수 없습니다."
+        )
+        logger.info(
+            f"   📋 총 {len(self.interacted_elements)}개 요소와 이미 상호작용 완료"
+        )
         return False
 
     async def _log_interaction_details(
@@ -425,10 +593,6 @@ class SPAContentScraper:
     ) -> None:
         """상호작용 상세 정보를 파일에 로깅"""
         try:
-            from datetime import datetime
-            import json
-            import os
-
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
             log_filename = (
                 f"log/interactions/interaction_{interaction_num}_{timestamp}.json"
@@ -449,45 +613,42 @@ class SPAContentScraper:
                 "logged_at": datetime.now().isoformat(),
             }
 
-            with open(log_filename, "w", encoding="utf-8") as f:
-                json.dump(log_data, f, ensure_ascii=False, indent=2)
+            # orjson으로 직렬화하고 파일 쓰기는 스레드에서 수행 (상호작용 루프를 막지 않음)
+            await asyncio.to_thread(
+                Path(log_filename).write_bytes,
+                orjson.dumps(log_data, default=str, option=orjson.OPT_INDENT_2),
+            )
 
-            print(f"   📄 상호작용 로그 저장: {log_filename}")
+            logger.info(f"   📄 상호작용 로그 저장: {log_filename}")
 
         except Exception as e:
-            print(f"   ⚠️ 상호작용 로그 저장 실패: {str(e)}")
-
-    async def _get_element_signature(self, element) -> str:
-        """요소의 간단한 식별자 생성"""
-        try:
-            text = (await element.text_content() or "").strip()
-            tag = await element.evaluate("el => el.tagName.toLowerCase()")
-            class_name = await element.get_attribute("class") or ""
-            element_id = await element.get_attribute("id") or ""
-            href = await element.get_attribute("href") or ""
-
-            # data attributes 수집
-            data_attrs = await element.evaluate("""el => {
-                const attrs = [];
-                for (let attr of el.attributes) {
-                    if (attr.name.startsWith('data-')) {
-                        attrs.push(`${attr.name}=${attr.value}`);
-                    }
-                }
-                return attrs.sort().join('|');
-            }""")
-
-            # 간단한 서명 생성: 태그명 + 텍스트 + 클래스 + ID + href + data attributes
-            signature = (
-                f"{tag}:{text[:50]}:{class_name}:{element_id}:{href}:{data_attrs}"
-            )
-            return signature
-        except Exception:
-            return f"unknown:{time.time()}"
+            logger.info(f"   ⚠️ 상호작용 로그 저장 실패: {str(e)}")
+
+    async def _get_visible_elements(
+        self, page: "Page", selector: str
+    ) -> List[Tuple[Any, str]]:
+        """선택자에 맞는 요소 중 보이고 활성화된 요소들의 (요소, 서명) 목록"""
+        elements = await page.query_selector_all(selector)
+        if not elements:
+            return []
+
+        # 요소마다 is_visible/is_enabled/서명 조회를 따로 호출하지 않고 브라우저에서 한 번에 계산
+        element_infos = await page.evaluate(_ELEMENT_INFOS_JS, elements)
+        return [
+            (element, info["signature"])
+            for element, info in zip(elements, element_infos)
+            if info["visible"] and info["enabled"]
+        ]
 
     def _deduplicate_products(
-        self, existing_products: List[ProductItem], new_products: List[ProductItem]
+        self, seen_keys: Set[str], new_products: List[ProductItem]
     ) -> List[ProductItem]:
-        """중복 제품 제거"""
-        existing_names = {p.product_name for p in existing_products}
-        return [p for p in new_products if p.product_name not in existing_names]
+        """중복 제품 제거 (seen_keys를 갱신하여 호출마다 기존 목록을 다시 훑지 않음)"""
+        unique_products = []
+        for product in new_products:
+            # 전각/반각, 공백 차이만 있는 이름은 같은 제품으로 취급
+            key = " ".join(unicodedata.normalize("NFKC", product.product_name).split())
+            if key not in seen_keys:
+                seen_keys.add(key)
+                unique_products.append(product)
+        return unique_products
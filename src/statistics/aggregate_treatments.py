@@ -4,12 +4,80 @@ PPEUM Global Clinic 스크래핑 데이터를 분석하여 다양한 통계를 
 """
 
 import argparse
-import json
+import numpy as np
+import orjson
 import pandas as pd
 from collections import Counter, defaultdict
+from dataclasses import dataclass
 from datetime import datetime
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+
+
+# 가격 없음을 나타내는 값 (원 단위 가격은 항상 0 이상)
+MISSING_PRICE = np.iinfo(np.int32).min
+
+
+# int32 가격 열에 저장할 수 있는 최대 가격
+MAX_PRICE = np.iinfo(np.int32).max
+
+
+def _to_price(value: Any, product_name: Optional[str]) -> int:
+    """가격 값을 int32 범위의 원 단위 정수로 변환 (없거나 잘못된 값은 MISSING_PRICE)"""
+    if value is None:
+        return MISSING_PRICE
+    try:
+        price = round(value)
+    except (TypeError, ValueError, OverflowError):
+        price = None
+    # LLM이 잘못 추출한 값 하나로 전체 분석이 중단되지 않도록 가격 없음으로 처리
+    if price is None or not 0 <= price <= MAX_PRICE:
+        print(f"⚠️  잘못된 가격 무시: {value!r} ({product_name})")
+        return MISSING_PRICE
+    return price
+
+
+@dataclass
+class ProductBatch:
+    """가격 분석용 열 지향(SoA) 상품 배치 (가격 열은 연속된 numpy 배열)"""
+
+    product_names: List[Optional[str]]
+    categories: List[Optional[str]]
+    original_prices: np.ndarray  # int32 원 단위, 가격 없음은 MISSING_PRICE
+    event_prices: np.ndarray  # int32 원 단위, 가격 없음은 MISSING_PRICE
+
+    @classmethod
+    def from_items(cls, items: List[Dict[str, Any]]) -> "ProductBatch":
+        """상품 딕셔너리 리스트에서 배치 생성"""
+
+        def to_price_array(key: str) -> np.ndarray:
+            # 원화 가격은 소수점 단위가 없으므로 정수로 저장 (float64 대비 절반 크기)
+            return np.array(
+                [_to_price(item.get(key), item.get("product_name")) for item in items],
+                dtype=np.int32,
+            )
+
+        return cls(
+            product_names=[item.get("product_name") for item in items],
+            categories=[item.get("category", "Unknown") for item in items],
+            original_prices=to_price_array("product_original_price"),
+            event_prices=to_price_array("product_event_price"),
+        )
+
+
+def _price_stats(prices: np.ndarray) -> Dict[str, Any]:
+    """가격 배열 통계 (가격 없음 제외, median은 정렬 후 n//2 번째 값)"""
+    prices = prices[prices != MISSING_PRICE]
+    count = len(prices)
+    if count == 0:
+        return {"count": 0, "mean": 0, "min": 0, "max": 0, "median": 0}
+    return {
+        "count": count,
+        "mean": prices.mean(dtype=np.float64).item(),
+        "min": int(prices.min()),
+        "max": int(prices.max()),
+        "median": int(np.partition(prices, count // 2)[count // 2]),
+    }
 
 
 class TreatmentDataAnalyzer:
@@ -24,12 +92,15 @@ class TreatmentDataAnalyzer:
         self.data = self._load_data()
         self.results = self.data.get("results", [])
         self.model_info = self.data.get("model_info", {})
+        # 가격 통계용 열 지향 배치 (가격 열만 연속 배열로 순회)
+        self.batch = ProductBatch.from_items(self.results)
 
     def _load_data(self) -> Dict[str, Any]:
         """JSON 데이터 로드"""
         try:
-            with open(self.json_file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            # 대용량 결과 파일도 빠르게 파싱하도록 orjson 사용
+            with open(self.json_file_path, "rb") as f:
+                return orjson.loads(f.read())
         except Exception as e:
             print(f"데이터 로드 오류: {e}")
             return {}
@@ -53,55 +124,30 @@ class TreatmentDataAnalyzer:
 
     def analyze_price_distribution(self) -> Dict[str, Any]:
         """가격 분포 분석"""
-        original_prices = []
-        event_prices = []
-        discount_rates = []
-
-        for item in self.results:
-            orig_price = item.get("product_original_price")
-            event_price = item.get("product_event_price")
-
-            if orig_price is not None:
-                original_prices.append(orig_price)
-            if event_price is not None:
-                event_prices.append(event_price)
-
-            if orig_price and event_price and orig_price > 0:
-                discount_rate = ((orig_price - event_price) / orig_price) * 100
-                discount_rates.append(discount_rate)
+        original_prices = self.batch.original_prices
+        event_prices = self.batch.event_prices
+
+        # 정상가/이벤트가가 모두 있고 정상가가 양수인 상품만 할인율 계산
+        discount_mask = (original_prices > 0) & (event_prices != 0)
+        discount_mask &= event_prices != MISSING_PRICE
+        discounted_originals = original_prices[discount_mask].astype(np.float64)
+        discount_rates = (
+            (discounted_originals - event_prices[discount_mask])
+            / discounted_originals
+            * 100
+        )
+        has_discounts = len(discount_rates) > 0
 
         return {
-            "original_price_stats": {
-                "count": len(original_prices),
-                "mean": (
-                    sum(original_prices) / len(original_prices)
-                    if original_prices
-                    else 0
-                ),
-                "min": min(original_prices) if original_prices else 0,
-                "max": max(original_prices) if original_prices else 0,
-                "median": (
-                    sorted(original_prices)[len(original_prices) // 2]
-                    if original_prices
-                    else 0
-                ),
-            },
-            "event_price_stats": {
-                "count": len(event_prices),
-                "mean": sum(event_prices) / len(event_prices) if event_prices else 0,
-                "min": min(event_prices) if event_prices else 0,
-                "max": max(event_prices) if event_prices else 0,
-                "median": (
-                    sorted(event_prices)[len(event_prices) // 2] if event_prices else 0
-                ),
-            },
+            "original_price_stats": _price_stats(original_prices),
+            "event_price_stats": _price_stats(event_prices),
             "discount_stats": {
                 "count": len(discount_rates),
                 "mean_discount_rate": (
-                    sum(discount_rates) / len(discount_rates) if discount_rates else 0
+                    discount_rates.mean().item() if has_discounts else 0
                 ),
-                "min_discount": min(discount_rates) if discount_rates else 0,
-                "max_discount": max(discount_rates) if discount_rates else 0,
+                "min_discount": discount_rates.min().item() if has_discounts else 0,
+                "max_discount": discount_rates.max().item() if has_discounts else 0,
             },
         }
 
@@ -152,28 +198,19 @@ class TreatmentDataAnalyzer:
 
     def analyze_categories(self) -> Dict[str, Any]:
         """카테고리별 분석"""
-        category_counts = Counter()
-        category_prices = defaultdict(list)
-
-        for item in self.results:
-            category = item.get("category", "Unknown")
-            category_counts[category] += 1
+        category_counts = Counter(self.batch.categories)
 
-            event_price = item.get("product_event_price")
-            if event_price is not None:
-                category_prices[category].append(event_price)
+        # 카테고리별 행 인덱스를 모아 가격 배열에서 한 번에 선택
+        category_indices = defaultdict(list)
+        for index, category in enumerate(self.batch.categories):
+            category_indices[category].append(index)
 
         # 카테고리별 가격 통계
         category_price_stats = {}
-        for category, prices in category_prices.items():
-            if prices:
-                category_price_stats[category] = {
-                    "count": len(prices),
-                    "mean": sum(prices) / len(prices),
-                    "min": min(prices),
-                    "max": max(prices),
-                    "median": sorted(prices)[len(prices) // 2],
-                }
+        for category, indices in category_indices.items():
+            stats = _price_stats(self.batch.event_prices[indices])
+            if stats["count"]:
+                category_price_stats[category] = stats
 
         return {
             "category_counts": dict(category_counts.most_common()),
@@ -262,8 +299,16 @@ class TreatmentDataAnalyzer:
         report = self.create_comprehensive_report(generated_files)
 
         # JSON 형태로 저장
-        with open(json_filename, "w", encoding="utf-8") as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        # orjson으로 직렬화 (numpy 값/숫자 키도 그대로 처리, UTF-8 그대로 출력)
+        with open(json_filename, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    report,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS,
+                )
+            )
         print(f"✅ JSON 리포트 저장: {json_filename}")
 
         return json_filename
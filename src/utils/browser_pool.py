@@ -0,0 +1,77 @@
+"""
+프로세스에서 공유하는 Playwright 브라우저와 context 풀
+Chromium은 한 번만 실행하고 URL마다 가벼운 BrowserContext만 만들어 사용
+"""
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Playwright, Route
+
+# 렌더링 결과(HTML)에 필요 없어 요청 자체를 차단할 리소스 유형
+# (stylesheet는 요소 표시 여부 판단에 필요하므로 허용)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# 동시에 열어둘 최대 context 수 (렌더링 프로세스 메모리/CPU 사용량 제한)
+DEFAULT_MAX_CONTEXTS = 8
+
+
+async def _block_heavy_resources(route: "Route") -> None:
+    """차단 대상 리소스 요청은 중단하고 나머지는 그대로 진행"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """지연 실행되는 공유 Chromium과 동시 context 수 제한 (async with 또는 aclose로 종료)"""
+
+    def __init__(self, max_contexts: int = DEFAULT_MAX_CONTEXTS):
+        self._playwright: Optional["Playwright"] = None
+        self._browser: Optional["Browser"] = None
+        self._lock = asyncio.Lock()
+        self._context_slots = asyncio.Semaphore(max_contexts)
+
+    async def __aenter__(self) -> "BrowserPool":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def get_browser(self) -> "Browser":
+        """공유 브라우저 반환 (최초 호출 시 실행, 연결이 끊겼으면 재실행)"""
+        # 정적 HTML만 쓰는 경로에서는 Playwright를 로드하지 않도록 실제 렌더링 시점에 import
+        from playwright.async_api import async_playwright
+
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"]
+                )
+            return self._browser
+
+    @contextlib.asynccontextmanager
+    async def context(self, **context_options: Any) -> AsyncIterator["BrowserContext"]:
+        """이미지/폰트/미디어 요청을 차단한 새 context (블록을 벗어나면 닫힘)"""
+        async with self._context_slots:
+            browser = await self.get_browser()
+            browser_context = await browser.new_context(**context_options)
+            try:
+                await browser_context.route("**/*", _block_heavy_resources)
+                yield browser_context
+            finally:
+                await browser_context.close()
+
+    async def aclose(self) -> None:
+        """공유 브라우저와 Playwright 종료 (스크래핑 종료 시 한 번 호출)"""
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
@@ -0,0 +1,52 @@
+"""
+URL 단위 스크래핑 체크포인트
+중단 후 재실행 시 이미 처리한 URL은 건너뛰고 저장된 결과를 복원
+"""
+
+from pathlib import Path
+from typing import Dict, List
+
+import orjson
+
+from src.models.schemas import ProductItem
+
+
+class ScrapeCheckpoint:
+    """처리 완료된 URL과 추출 결과를 JSONL 파일에 한 줄씩 추가 기록"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def load(self) -> Dict[str, List[ProductItem]]:
+        """저장된 체크포인트 로드 (URL → 추출된 상품 리스트)"""
+        try:
+            lines = self.path.read_bytes().splitlines()
+        except FileNotFoundError:
+            return {}
+
+        completed = {}
+        for line in lines:
+            try:
+                entry = orjson.loads(line)
+                completed[entry["url"]] = [
+                    ProductItem.model_validate(product) for product in entry["products"]
+                ]
+            except (orjson.JSONDecodeError, KeyError, TypeError):
+                # 기록 중 중단되어 잘린 줄 등은 건너뜀 (해당 URL은 다시 스크래핑)
+                continue
+        return completed
+
+    def mark_done(self, url: str, products: List[ProductItem]) -> None:
+        """URL 처리 완료 기록 (파일 전체를 다시 쓰지 않고 한 줄만 추가)"""
+        entry = {
+            "url": url,
+            "products": [product.model_dump(mode="json") for product in products],
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("ab") as f:
+            f.write(orjson.dumps(entry) + b"\n")
+
+    def clear(self) -> None:
+        """모든 URL 처리 완료 시 체크포인트 삭제"""
+        self.path.unlink(missing_ok=True)
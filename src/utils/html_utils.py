@@ -0,0 +1,89 @@
+"""
+LLM 추출 전 HTML 전처리 유틸리티
+"""
+
+import re
+
+import lxml.html
+from lxml import etree
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # selectolax 미설치 시 lxml로 대체
+    HTMLParser = None
+
+# 텍스트 추출 시 제거할 태그들 (svg 내부 텍스트/아이콘 제목, JS 미지원 안내문 포함)
+NOISE_TAGS = ("script", "style", "noscript", "svg", "nav", "footer", "header")
+
+# 가격 표기 패턴 (₩10,000 / 10,000원 / 5만원)
+_PRICE_TEXT_RE = re.compile(r"₩\s*\d|\d[\d,]*\s*(?:만\s*)?원")
+
+# 상품/가격 정보가 있는 페이지에 나타나는 표기 (통화 기호, 천 단위 숫자, 상품 관련 단어)
+_PRODUCT_MARKER_RE = re.compile(
+    r"₩|KRW|\d{1,3}(?:,\d{3})+|가격|시술|이벤트|price|product|treatment",
+    re.IGNORECASE,
+)
+
+# 가격 텍스트에서 상품 카드/목록 항목 단위까지 올라갈 조상 단계 수
+CANDIDATE_ANCESTOR_DEPTH = 3
+
+
+def html_to_text(html_content: str) -> str:
+    """HTML에서 불필요한 태그를 제거하고 텍스트만 추출"""
+    if HTMLParser is not None:
+        tree = HTMLParser(html_content)
+        # 불필요한 태그를 한 번의 호출로 제거
+        tree.strip_tags(list(NOISE_TAGS))
+
+        root = tree.body or tree.root
+        if root is None:
+            return ""
+        return root.text(separator=" ", strip=True)
+
+    # selectolax가 없으면 lxml로 직접 파싱 (BeautifulSoup 래퍼 없이 C 레벨 처리)
+    if not html_content.strip():
+        return ""
+    doc = lxml.html.fromstring(html_content)
+
+    # 불필요한 태그를 한 번의 C 레벨 순회로 제거 (뒤따르는 tail 텍스트는 유지)
+    etree.strip_elements(doc, *NOISE_TAGS, with_tail=False)
+
+    # text_content()는 인접 블록 텍스트를 공백 없이 붙이므로 텍스트 노드 단위로 결합
+    return " ".join(text.strip() for text in doc.itertext() if text.strip())
+
+
+def html_to_candidate_text(html_content: str) -> str:
+    """가격 표기가 있는 영역(상품 카드 등)의 텍스트만 문서 순서대로 추출"""
+    if not html_content.strip():
+        return ""
+    doc = lxml.html.fromstring(html_content)
+    etree.strip_elements(doc, *NOISE_TAGS, with_tail=False)
+
+    # 가격 텍스트를 포함한 요소에서 몇 단계 위 조상을 후보 영역으로 선택
+    regions = set()
+    for text_node in doc.xpath("//text()"):
+        if not _PRICE_TEXT_RE.search(text_node):
+            continue
+        element = text_node.getparent()
+        if text_node.is_tail:
+            element = element.getparent()
+        for _ in range(CANDIDATE_ANCESTOR_DEPTH):
+            if element is None or element.getparent() is None:
+                break
+            element = element.getparent()
+        if element is not None:
+            regions.add(element)
+
+    # 다른 후보 영역 안에 포함된 영역은 제외하고 문서 순서대로 결합
+    texts = []
+    for element in doc.iter():
+        if element in regions and not any(
+            ancestor in regions for ancestor in element.iterancestors()
+        ):
+            texts.extend(text.strip() for text in element.itertext() if text.strip())
+    return " ".join(texts)
+
+
+def has_product_marker(text: str) -> bool:
+    """텍스트에 가격/상품 정보 표기가 하나라도 있는지 확인 (메뉴/모달만 있는 화면 걸러내기)"""
+    return bool(_PRICE_TEXT_RE.search(text) or _PRODUCT_MARKER_RE.search(text))
@@ -0,0 +1,76 @@
+"""
+프로세스 전역에서 공유하는 aiohttp 세션 관리
+커넥션 풀/TLS 세션을 재사용하여 요청마다 핸드셰이크 비용이 들지 않도록 함
+"""
+
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+from src.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def create_session() -> aiohttp.ClientSession:
+    """튜닝된 커넥터로 새 ClientSession 생성 (호출 측에서 직접 관리/종료할 때 사용)"""
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=10,
+        # 같은 호스트로 반복 요청하므로 DNS 결과를 길게 캐시
+        use_dns_cache=True,
+        ttl_dns_cache=600,
+        keepalive_timeout=75,
+        # 비정상 종료된 TLS 연결 정리 (장시간 실행 시 소켓 누수 방지)
+        enable_cleanup_closed=True,
+    )
+    # 쿠키가 필요 없는 스크래핑이므로 수천 개 URL을 돌며 쿠키가 쌓이지 않도록 저장하지 않음
+    return aiohttp.ClientSession(
+        connector=connector, cookie_jar=aiohttp.DummyCookieJar()
+    )
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """공유 ClientSession 반환 (없거나 닫혔으면 새로 생성)"""
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        # 다른 이벤트 루프에서 만든 세션은 교체 전에 닫아 커넥터/소켓이 남지 않도록 함
+        if _session is not None and not _session.closed:
+            await _close_stale_session(_session, _session_loop)
+        _session = create_session()
+        _session_loop = loop
+
+    return _session
+
+
+async def _close_stale_session(
+    session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop
+) -> None:
+    """이전 이벤트 루프에서 만든 세션 종료"""
+    if loop.is_closed():
+        # 닫힌 루프의 연결은 이미 끊겼으므로 커넥터를 닫힘 상태로만 표시 (다른 루프에서 대기 가능)
+        await session.close()
+        return
+
+    # 아직 살아 있는 루프(다른 스레드 등)의 세션은 해당 루프에서 닫도록 예약
+    logger.info("⚠️  다른 이벤트 루프의 HTTP 세션을 해당 루프에서 종료하도록 예약")
+    asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+
+async def close_session() -> None:
+    """공유 ClientSession 종료 (애플리케이션 종료 시 한 번 호출)"""
+    global _session, _session_loop
+
+    if _session is not None and not _session.closed:
+        if _session_loop is asyncio.get_running_loop():
+            await _session.close()
+        else:
+            await _close_stale_session(_session, _session_loop)
+    _session = None
+    _session_loop = None
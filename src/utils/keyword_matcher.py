@@ -0,0 +1,59 @@
+"""
+여러 키워드를 한 번의 스캔으로 찾는 부분 문자열 매칭 유틸리티
+"""
+
+import re
+from typing import Dict, Iterable, List, Mapping
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick 미설치 시 키워드별 부분 문자열 검사로 대체
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """Aho–Corasick 오토마톤 기반 다중 키워드 매처"""
+
+    def __init__(self, keywords: Iterable[str]):
+        # 중복/빈 키워드 제거 (입력 순서 유지)
+        self.keywords = tuple(dict.fromkeys(k for k in keywords if k))
+        self._automaton = None
+        self._pattern = None
+
+        if ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+        elif self.keywords:
+            # pyahocorasick이 없으면 포함 여부는 미리 컴파일한 alternation 정규식 한 번으로 검사
+            self._pattern = re.compile("|".join(map(re.escape, self.keywords)))
+
+    def find_all(self, text: str) -> List[str]:
+        """텍스트에 포함된 키워드 목록 반환 (키워드당 한 번)"""
+        if self._automaton is not None:
+            return list(dict.fromkeys(kw for _, kw in self._automaton.iter(text)))
+        return [kw for kw in self.keywords if kw in text]
+
+    def contains_any(self, text: str) -> bool:
+        """키워드 중 하나라도 포함되어 있는지 확인"""
+        if self._automaton is not None:
+            for _ in self._automaton.iter(text):
+                return True
+            return False
+        if self._pattern is not None:
+            return self._pattern.search(text) is not None
+        return False
+
+
+class KeywordScorer:
+    """키워드별 가중치 합계를 한 번의 스캔으로 계산하는 점수기"""
+
+    def __init__(self, weights: Mapping[str, int]):
+        self.weights: Dict[str, int] = {kw: w for kw, w in weights.items() if kw}
+        self._matcher = KeywordMatcher(self.weights)
+
+    def score(self, text: str) -> int:
+        """텍스트에 포함된 키워드들의 가중치 합 (키워드당 한 번)"""
+        return sum(self.weights[kw] for kw in self._matcher.find_all(text))
@@ -0,0 +1,229 @@
+"""
+페이지별 LLM 추출 요청을 모아 배치로 처리하는 유틸리티
+짧은 대기 시간 동안 들어온 URL들을 묶어 한 번의 LLM 요청으로 추출
+응답 길이가 비슷한 페이지끼리 묶어 긴 응답 하나가 배치 전체를 지연시키지 않도록 함
+"""
+
+import asyncio
+import functools
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.models.schemas import ProductItem
+from src.utils.llm_extractor import LLMExtractionError, LLMTreatmentExtractor
+from src.utils.url_utils import canonicalize_url, parse_url
+
+# 배치를 모으기 위해 첫 요청 이후 기다리는 최대 시간 (초)
+DEFAULT_MAX_WAIT = 0.05
+
+# 응답 길이 구간 (페이지당 추출 상품 수 기준: 짧음/보통/김)
+SHORT_BIN, MEDIUM_BIN, LONG_BIN = 0, 1, 2
+SHORT_MAX_PRODUCTS = 2
+MEDIUM_MAX_PRODUCTS = 8
+
+# URL 템플릿별 상품 수 지수이동평균 가중치
+LENGTH_EMA_ALPHA = 0.3
+
+# UUID/숫자/긴 해시 등 상세 페이지 식별자 경로 세그먼트
+_ID_SEGMENT_RE = re.compile(
+    r"^(?:\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{16,})$",
+    re.IGNORECASE,
+)
+
+BatchItem = Tuple[str, asyncio.Future]
+
+
+def _url_template(url: str) -> str:
+    """식별자 세그먼트를 {id}로 치환한 URL 템플릿 (예: host/products/{id})"""
+    parsed = parse_url(url)
+    segments = [
+        "{id}" if _ID_SEGMENT_RE.match(segment) else segment
+        for segment in parsed.path.split("/")
+        if segment
+    ]
+    return "/".join([parsed.netloc.lower(), *segments])
+
+
+def _length_bin(product_count: float) -> int:
+    """예상 상품 수를 응답 길이 구간으로 변환"""
+    if product_count <= SHORT_MAX_PRODUCTS:
+        return SHORT_BIN
+    if product_count <= MEDIUM_MAX_PRODUCTS:
+        return MEDIUM_BIN
+    return LONG_BIN
+
+
+class LLMBatcher:
+    """URL 단위 추출 요청을 최대 max_batch개씩 묶어 처리 (async with 블록 안에서 사용)"""
+
+    def __init__(
+        self,
+        llm_extractor: LLMTreatmentExtractor,
+        max_batch: int,
+        render_js: bool = True,
+        max_wait: float = DEFAULT_MAX_WAIT,
+    ):
+        self.llm_extractor = llm_extractor
+        self.max_batch = max(1, max_batch)
+        self.render_js = render_js
+        self.max_wait = max_wait
+
+        self._queue: asyncio.Queue[BatchItem] = asyncio.Queue()
+        # 응답 길이 구간별로 모으는 중인 배치와 flush 기한
+        self._bins: Dict[int, List[BatchItem]] = {}
+        self._deadlines: Dict[int, float] = {}
+        # URL 템플릿 → 페이지당 추출 상품 수 지수이동평균
+        self._len_stats: Dict[str, float] = {}
+        self._batcher_task: Optional[asyncio.Task] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+        # 정규화된 URL → 추출 결과 Future (동시에 요청된 같은 페이지는 한 번만 추출)
+        # 결과를 모든 호출자가 받았거나 실패/취소되면 제거하여 URL 수만큼 쌓이지 않음
+        self._results: Dict[str, asyncio.Future] = {}
+        # 추출 Future → 결과를 기다리는 호출자 수
+        self._waiters: Dict[asyncio.Future, int] = {}
+
+    async def __aenter__(self) -> "LLMBatcher":
+        self._batcher_task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """배치 수집 task와 진행 중인 배치 취소"""
+        tasks = list(self._batch_tasks)
+        if self._batcher_task is not None:
+            tasks.append(self._batcher_task)
+            self._batcher_task = None
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # 아직 배치에 들어가지 못한 요청도 취소
+        for batch in self._bins.values():
+            for _, future in batch:
+                future.cancel()
+        self._bins.clear()
+        self._deadlines.clear()
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+    async def extract(self, url: str) -> List[ProductItem]:
+        """URL을 다음 배치에 추가하고 해당 URL의 추출 결과를 기다림"""
+        if self._batcher_task is None:
+            raise RuntimeError("LLMBatcher는 async with 블록 안에서 사용해야 합니다")
+
+        # 쿼리 순서/추적 파라미터/끝 슬래시만 다른 URL은 이미 요청된 결과를 공유
+        key = canonicalize_url(url)
+        future = self._results.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._results[key] = future
+            future.add_done_callback(functools.partial(self._on_result_done, key))
+            self._queue.put_nowait((url, future))
+
+        self._waiters[future] = self._waiters.get(future, 0) + 1
+        try:
+            # 한 호출자가 취소되어도 같은 페이지를 기다리는 다른 호출자에 영향이 없도록 shield
+            return list(await asyncio.shield(future))
+        finally:
+            remaining = self._waiters.pop(future) - 1
+            if remaining:
+                self._waiters[future] = remaining
+            elif future.done():
+                self._forget(key, future)
+
+    def _on_result_done(self, key: str, future: asyncio.Future) -> None:
+        """실패/취소된 결과나 기다리는 호출자가 없는 결과는 바로 제거 (다음 요청 시 다시 추출)"""
+        # exception() 호출로 호출자가 모두 떠난 뒤의 예외도 처리된 것으로 표시
+        if (
+            future.cancelled()
+            or future.exception() is not None
+            or future not in self._waiters
+        ):
+            self._forget(key, future)
+
+    def _forget(self, key: str, future: asyncio.Future) -> None:
+        """같은 URL의 새 요청이 이미 등록되었으면 그대로 두고 해당 Future만 제거"""
+        if self._results.get(key) is future:
+            del self._results[key]
+
+    def _predict_bin(self, url: str) -> int:
+        """URL 템플릿의 과거 추출 결과(없으면 URL 형태)로 응답 길이 구간 예측"""
+        template = _url_template(url)
+        product_count = self._len_stats.get(template)
+        if product_count is not None:
+            return _length_bin(product_count)
+        # 상세 페이지(식별자 세그먼트 포함)는 상품이 적고, 목록 페이지는 보통 길이로 가정
+        return SHORT_BIN if "{id}" in template else MEDIUM_BIN
+
+    def _record_length(self, url: str, product_count: int) -> None:
+        """실제 추출 상품 수로 URL 템플릿별 지수이동평균 갱신"""
+        template = _url_template(url)
+        previous = self._len_stats.get(template)
+        self._len_stats[template] = (
+            float(product_count)
+            if previous is None
+            else previous + LENGTH_EMA_ALPHA * (product_count - previous)
+        )
+
+    async def _run(self) -> None:
+        """요청을 길이 구간별로 max_batch개 또는 max_wait 시간까지 모아 배치 단위로 실행"""
+        loop = asyncio.get_running_loop()
+        while True:
+            timeout = None
+            if self._deadlines:
+                timeout = max(0.0, min(self._deadlines.values()) - loop.time())
+            try:
+                url, future = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                length_bin = self._predict_bin(url)
+                batch = self._bins.setdefault(length_bin, [])
+                batch.append((url, future))
+                self._deadlines.setdefault(length_bin, loop.time() + self.max_wait)
+                if len(batch) >= self.max_batch:
+                    self._flush(length_bin)
+
+            # 기한이 지난 구간은 max_batch에 못 미쳐도 실행
+            now = loop.time()
+            for length_bin, deadline in list(self._deadlines.items()):
+                if deadline <= now:
+                    self._flush(length_bin)
+
+    def _flush(self, length_bin: int) -> None:
+        """구간에 모인 배치를 별도 task로 실행 (처리 중에도 다음 배치를 모을 수 있음)"""
+        batch = self._bins.pop(length_bin)
+        self._deadlines.pop(length_bin, None)
+        task = asyncio.create_task(self._process_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _process_batch(self, batch: List[BatchItem]) -> None:
+        """배치를 한 번에 추출하고 요청별 Future에 결과 전달"""
+        try:
+            results = await self.llm_extractor.extract_treatments_from_urls(
+                [url for url, _ in batch], render_js=self.render_js
+            )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (url, future), products in zip(batch, results):
+            if future.done():
+                continue
+            # 추출 실패는 예외로 전달하여 빈 페이지와 구분 (호출 측이 완료로 기록하지 않도록)
+            if products is None:
+                future.set_exception(LLMExtractionError(f"추출 실패: {url}"))
+                continue
+            self._record_length(url, len(products))
+            future.set_result(products)
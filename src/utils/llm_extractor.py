@@ -1,25 +1,127 @@
 import asyncio
-import json
 import os
 import re
 import time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
-from bs4 import BeautifulSoup
-from dotenv import load_dotenv
-from playwright.async_api import async_playwright
-from tqdm import tqdm
+import aiohttp
+import orjson
+from pydantic import ValidationError
 
+from src.config.env import load_env
 from src.models.schemas import (
     IndividualTreatment,
     ProductItem,
     TreatmentType,
 )
-from src.utils.llm_providers import create_llm_provider
+from src.utils.browser_pool import BrowserPool
+from src.utils.html_utils import (
+    has_product_marker,
+    html_to_candidate_text,
+    html_to_text,
+)
+from src.utils.http import get_session
+from src.utils.llm_providers import (
+    LLMAuthError,
+    LLMRateLimitError,
+    create_llm_provider,
+)
+from src.utils.log import get_logger
+from src.utils.price_utils import (
+    ORIGINAL_PRICE_LABEL_RE,
+    SALE_PRICE_LABEL_RE,
+    parse_won,
+)
 from src.utils.prompt_manager import PromptManager
+from src.utils.rate_limiter import domain_rate_limiter
+from src.utils.scrape_cache import ScrapeCache, make_cache_key
+from src.utils.url_utils import canonicalize_url, parse_url
 
 # .env 파일 로드
-load_dotenv()
+load_env()
+
+logger = get_logger(__name__)
+
+# 페이지 요청 시 사용할 User-Agent
+_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# LLM에 전달할 텍스트 길이 범위
+MAX_TEXT_LENGTH = 10000
+MIN_TEXT_LENGTH = 100
+
+# 프롬프트별 추출 결과 메모리 캐시 크기 (같은 텍스트의 페이지/상태는 LLM 호출 생략)
+LLM_CACHE_SIZE = 1024
+
+# 실행 간에 추출 결과를 재사용하기 위한 디스크 캐시 위치 (HTML 캐시와 분리)
+LLM_CACHE_DIR = ".llm_cache"
+
+# 배치 요청 크기 제한 (긴 페이지는 단독 요청, 짧은 페이지는 합계 길이 이내로 묶음)
+# 배치 응답은 여러 페이지의 JSON을 한 번에 출력하므로 출력 길이 제한을 넘지 않도록 함
+BATCH_PAGE_MAX_TEXT_LENGTH = 5000
+MAX_BATCH_TEXT_LENGTH = 20000
+
+# 정적 HTML 최대 크기와 읽기 단위
+MAX_HTML_BYTES = 5 * 1024 * 1024
+HTML_CHUNK_SIZE = 64 * 1024
+
+# LLM 응답/가격 파싱용 정규식 (모듈 로드 시 한 번만 컴파일)
+_JSON_CODE_BLOCK_RE = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",(\s*[}\]])")
+# Rate limit 오류 메시지 판별 (lower() 반복 호출 없이 한 번의 스캔)
+_RATE_LIMIT_RE = re.compile(r"429|quota|exceeded", re.IGNORECASE)
+# 인증/권한 오류 메시지 판별
+_AUTH_ERROR_RE = re.compile(
+    r"\b40[13]\b|unauthori[sz]ed|permission denied|invalid api key|api key not valid",
+    re.IGNORECASE,
+)
+
+
+# LLM 응답의 시술 유형 문자열 → TreatmentType (시술마다 dict를 새로 만들지 않도록 모듈 상수로 유지)
+_TREATMENT_TYPE_MAPPING = {
+    treatment_type.value: treatment_type for treatment_type in TreatmentType
+}
+
+# 알려진 도메인 → 클리닉/채널명
+_KNOWN_CLINIC_HOSTS = (
+    ("xenia.clinic", "세니아 클리닉"),
+    ("feeline.network", "피라인 네트워크"),
+    ("gu.clinic", "GU 클리닉"),
+    ("beautyleader.co.kr", "뷰티리더"),
+    ("global.ppeum.com", "쁨글로벌의원"),
+)
+
+
+def _known_clinic_for_host(host: str) -> Optional[str]:
+    for known_host, name in _KNOWN_CLINIC_HOSTS:
+        if known_host in host:
+            return name
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _source_channel_for_host(host: str) -> str:
+    """도메인별 정보 수집 채널명 (상품마다 호출되므로 도메인 단위로 캐시)"""
+    return _known_clinic_for_host(host) or host.replace("www.", "")
+
+
+@lru_cache(maxsize=4096)
+def _clinic_name_for_host(host: str) -> str:
+    """도메인별 클리닉 이름 (상품마다 호출되므로 도메인 단위로 캐시)"""
+    known_name = _known_clinic_for_host(host)
+    if known_name:
+        return known_name
+
+    domain = host.replace("www.", "")
+    name = domain.replace(".com", "").replace(".co.kr", "").title()
+    return name + " 클리닉" if "clinic" in domain else name
+
+
+class LLMExtractionError(Exception):
+    """페이지 가져오기/LLM 요청/응답 파싱 실패 (상품이 없는 페이지와 구분)"""
 
 
 class LLMTreatmentExtractor:
@@ -30,6 +132,8 @@ class LLMTreatmentExtractor:
         provider_type: str,
         api_key: Optional[str] = None,
         requests_per_minute: int = 10,
+        session: Optional[aiohttp.ClientSession] = None,
+        browser_pool: Optional[BrowserPool] = None,
     ):
         self.provider_type = provider_type.lower()
 
@@ -54,126 +158,285 @@ class LLMTreatmentExtractor:
         # 프롬프트 매니저 초기화
         self.prompt_manager = PromptManager()
 
-    async def extract_treatments_from_url(self, source_url: str) -> List[ProductItem]:
-        """URL에서 JavaScript 렌더링 후 시술 정보를 추출합니다."""
-        # Playwright로 JavaScript 렌더링 후 HTML 추출
-        html_content = await self._fetch_rendered_html(source_url)
+        # 정적 HTML 요청에 사용할 세션 (없으면 프로세스 공유 세션 사용)
+        self.session = session
+
+        # 렌더링된 HTML 디스크 캐시 (반복 실행 시 브라우저 렌더링 생략)
+        self.scrape_cache = ScrapeCache()
+
+        # 프롬프트 해시 → 추출 결과 LRU 캐시 (메모리에 없으면 디스크 캐시 확인)
+        self._llm_cache: "OrderedDict[str, List[ProductItem]]" = OrderedDict()
+        self.llm_disk_cache = ScrapeCache(directory=LLM_CACHE_DIR)
+
+        # URL 간에 공유하는 Playwright 브라우저 풀 (첫 렌더링 시 지연 실행)
+        # 주입된 풀은 호출 측이 종료하고, 직접 만든 풀만 aclose()에서 종료
+        self._owns_browser_pool = browser_pool is None
+        self.browser_pool = browser_pool or BrowserPool()
+
+    async def extract_treatments_from_url(
+        self, source_url: str, force_rescrape: bool = False, render_js: bool = True
+    ) -> List[ProductItem]:
+        """URL에서 HTML을 가져와 시술 정보를 추출합니다 (render_js=False면 정적 HTML 우선)."""
+        html_content = await self._get_html(source_url, force_rescrape, render_js)
         if not html_content:
             return []
 
         return await self.extract_treatments_from_html_async(html_content, source_url)
 
-    async def extract_treatments_from_html_async(
-        self, html_content: str, source_url: str
-    ) -> List[ProductItem]:
-        """HTML 기반 비동기 추출 메소드"""
-        # HTML을 텍스트로 변환
-        soup = BeautifulSoup(html_content, "html.parser")
+    async def extract_treatments_from_urls(
+        self,
+        source_urls: List[str],
+        force_rescrape: bool = False,
+        render_js: bool = True,
+    ) -> List[Optional[List[ProductItem]]]:
+        """여러 URL의 페이지를 하나의 LLM 요청으로 묶어 추출 (결과는 입력 순서와 동일)"""
+        # 가져오기/LLM 요청/응답 파싱에 실패한 페이지는 None, 상품이 없는 페이지는 빈 리스트
+        html_contents = await asyncio.gather(
+            *(self._get_html(url, force_rescrape, render_js) for url in source_urls)
+        )
 
-        # 불필요한 태그 제거
-        for tag in soup(["script", "style", "nav", "footer", "header"]):
-            tag.decompose()
+        # HTML → 텍스트 변환은 CPU 작업이므로 스레드에서 수행 (이벤트 루프 차단 방지)
+        fetched = [
+            (index, html_content)
+            for index, html_content in enumerate(html_contents)
+            if html_content
+        ]
+        text_contents = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._prepare_text_content, html_content, source_urls[index]
+                )
+                for index, html_content in fetched
+            )
+        )
 
-        text_content = soup.get_text(separator=" ", strip=True)
+        # HTML을 가져오지 못한 페이지는 실패(None)로 남김
+        results: List[Optional[List[ProductItem]]] = [None for _ in source_urls]
+        for index, _ in fetched:
+            results[index] = []
+        pages = [  # (입력 인덱스, 텍스트)
+            (index, text_content)
+            for (index, _), text_content in zip(fetched, text_contents)
+            if text_content is not None
+        ]
+
+        # 긴 페이지는 단독으로, 짧은 페이지는 합계 길이 제한 안에서 묶어 동시에 요청
+        groups: List[List[Tuple[int, str]]] = []
+        batch: List[Tuple[int, str]] = []
+        batch_length = 0
+        for index, text_content in pages:
+            if len(text_content) > BATCH_PAGE_MAX_TEXT_LENGTH:
+                groups.append([(index, text_content)])
+                continue
+            if batch and batch_length + len(text_content) > MAX_BATCH_TEXT_LENGTH:
+                groups.append(batch)
+                batch, batch_length = [], 0
+            batch.append((index, text_content))
+            batch_length += len(text_content)
+        if batch:
+            groups.append(batch)
+
+        group_results = await asyncio.gather(
+            *(self._extract_page_group(group, source_urls) for group in groups)
+        )
+        for group, products_per_page in zip(groups, group_results):
+            for (index, _), products in zip(group, products_per_page):
+                results[index] = products
+
+        return results
+
+    async def _extract_page_group(
+        self, group: List[Tuple[int, str]], source_urls: List[str]
+    ) -> List[Optional[List[ProductItem]]]:
+        """페이지 묶음 추출 (한 페이지면 일반 요청, 여러 페이지면 배치 요청)"""
+        if len(group) == 1:
+            index, text_content = group[0]
+            prompt = self._create_extraction_prompt(text_content, source_urls[index])
+            return [
+                await self._make_api_request_with_retry_async(
+                    prompt, source_urls[index], text_content
+                )
+            ]
 
-        # 텍스트 크기를 줄여서 JSON 응답 길이 제한 (Gemini 출력 제한 방지)
-        if len(text_content) > 10000:
-            text_content = text_content[:10000] + "..."
+        return await self._make_batch_api_request_with_retry_async(
+            [text_content for _, text_content in group],
+            [source_urls[index] for index, _ in group],
+        )
 
-        # 텍스트가 너무 짧으면 추출할 의미가 없음
-        if len(text_content.strip()) < 100:
-            tqdm.write(
-                f"⚠️  텍스트가 너무 짧습니다 ({len(text_content.strip())} chars): {source_url}"
-            )
+    async def extract_treatments_from_html_async(
+        self, html_content: str, source_url: str
+    ) -> List[ProductItem]:
+        """HTML 기반 비동기 추출 메소드"""
+        # HTML → 텍스트 변환은 CPU 작업이므로 스레드에서 수행 (이벤트 루프 차단 방지)
+        text_content = await asyncio.to_thread(
+            self._prepare_text_content, html_content, source_url
+        )
+        if text_content is None:
             return []
 
         # 프롬프트 생성
         prompt = self._create_extraction_prompt(text_content, source_url)
 
-        return await self._make_api_request_with_retry_async(
+        products = await self._make_api_request_with_retry_async(
             prompt, source_url, text_content
         )
+        return products or []
 
     def extract_treatments_from_html(
         self, html_content: str, source_url: str
     ) -> List[ProductItem]:
         """동기 HTML 기반 추출 메소드 (하위 호환성)"""
-        # HTML을 텍스트로 변환
-        soup = BeautifulSoup(html_content, "html.parser")
+        text_content = self._prepare_text_content(html_content, source_url)
+        if text_content is None:
+            return []
 
-        # 불필요한 태그 제거
-        for tag in soup(["script", "style", "nav", "footer", "header"]):
-            tag.decompose()
+        # 프롬프트 생성
+        prompt = self._create_extraction_prompt(text_content, source_url)
 
-        text_content = soup.get_text(separator=" ", strip=True)
+        return self._make_api_request_with_retry(prompt, source_url, text_content)
 
-        # 텍스트 크기를 줄여서 JSON 응답 길이 제한 (Gemini 출력 제한 방지)
-        if len(text_content) > 10000:
-            text_content = text_content[:10000] + "..."
+    def _prepare_text_content(
+        self, html_content: str, source_url: str
+    ) -> Optional[str]:
+        """HTML을 LLM 입력용 텍스트로 변환 (너무 짧으면 None 반환)"""
+        # html_to_text 결과는 이미 앞뒤 공백이 제거되어 있으므로 길이만 한 번 계산
+        text_content = html_to_text(html_content)
+        text_length = len(text_content)
 
         # 텍스트가 너무 짧으면 추출할 의미가 없음
-        if len(text_content.strip()) < 100:
-            tqdm.write(
-                f"⚠️  텍스트가 너무 짧습니다 ({len(text_content.strip())} chars): {source_url}"
+        if text_length < MIN_TEXT_LENGTH:
+            logger.info(
+                f"⚠️  텍스트가 너무 짧습니다 ({text_length} chars): {source_url}"
             )
-            return []
-
-        # 프롬프트 생성
-        prompt = self._create_extraction_prompt(text_content, source_url)
+            return None
 
-        return self._make_api_request_with_retry(prompt, source_url, text_content)
+        # 가격/상품 표기가 전혀 없는 화면(메뉴, 모달 등)은 LLM 호출 생략
+        if not has_product_marker(text_content):
+            logger.info(f"⏭️  가격/상품 정보 표기 없음, 추출 생략: {source_url}")
+            return None
 
-    async def _fetch_rendered_html(self, url: str) -> Optional[str]:
-        """Playwright를 사용하여 JavaScript 렌더링 후 HTML을 가져옵니다."""
-        try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                    viewport={"width": 1920, "height": 1080},
+        # 긴 페이지는 가격 표기 주변 영역만 남김 (앞부분만 잘라 가격 정보가 빠지는 것 방지)
+        if text_length > MAX_TEXT_LENGTH:
+            candidate_text = html_to_candidate_text(html_content)
+            if len(candidate_text) >= MIN_TEXT_LENGTH:
+                logger.info(
+                    f"✂️  가격 영역만 추출: {text_length} → {len(candidate_text)} chars"
                 )
-                page = await context.new_page()
+                text_content = candidate_text
+                text_length = len(candidate_text)
 
-                try:
-                    # 페이지 로드
-                    await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        # 텍스트 크기를 줄여서 JSON 응답 길이 제한 (Gemini 출력 제한 방지)
+        if text_length > MAX_TEXT_LENGTH:
+            text_content = text_content[:MAX_TEXT_LENGTH] + "..."
+
+        return text_content
+
+    async def _get_html(
+        self, url: str, force_rescrape: bool, render_js: bool
+    ) -> Optional[str]:
+        """캐시된 HTML 반환 (없으면 가져와서 캐시에 저장)"""
+        # 정적 HTML과 렌더링 결과를 구분하여 캐시 (정적 셸이 렌더링 요청에 재사용되지 않도록)
+        cache_key = make_cache_key(canonicalize_url(url), render_js)
+        html_content = None if force_rescrape else self.scrape_cache.get(cache_key)
+
+        if html_content is None:
+            html_content = await self._fetch_html(url, render_js)
+            if html_content:
+                self.scrape_cache.set(cache_key, html_content)
+        else:
+            logger.info(f"💾 캐시된 HTML 사용: {url}")
+
+        return html_content
+
+    async def _fetch_html(self, url: str, render_js: bool) -> Optional[str]:
+        """정적 HTML 우선 시도 후 필요 시 Playwright 렌더링으로 대체"""
+        if not render_js:
+            html_content = await self._fetch_static_html(url)
+            # 정적 HTML에 본문 텍스트가 충분하면 브라우저 렌더링 생략
+            if (
+                html_content
+                and len(await asyncio.to_thread(html_to_text, html_content))
+                >= MIN_TEXT_LENGTH
+            ):
+                return html_content
+            logger.info(f"🔁 정적 HTML 본문 부족, 브라우저 렌더링으로 재시도: {url}")
+
+        # Playwright로 JavaScript 렌더링 후 HTML 추출
+        return await self._fetch_rendered_html(url)
 
-                    # JavaScript 실행 완료 대기
-                    await page.wait_for_timeout(3000)
+    async def _fetch_static_html(self, url: str) -> Optional[str]:
+        """공유 HTTP 세션으로 정적 HTML을 가져옵니다 (브라우저 실행 없음)."""
+        try:
+            session = self.session or await get_session()
+            await domain_rate_limiter.acquire(url)
+            async with session.get(
+                url,
+                headers={"User-Agent": _USER_AGENT},
+                # 청크 사이 대기도 제한하여 느리게 응답하는 서버가 연결을 오래 잡지 않도록 함
+                timeout=aiohttp.ClientTimeout(total=30, sock_read=10),
+            ) as response:
+                if response.status != 200 or "html" not in response.content_type:
+                    return None
 
-                    # 콘텐츠 요소가 로드될 때까지 대기
-                    try:
-                        await page.wait_for_selector(
-                            "main, .content, .product, h1, h2, p", timeout=10000
+                # 청크 단위로 최대 크기까지만 읽음 (거대한 페이지를 통째로 적재하지 않음)
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(HTML_CHUNK_SIZE):
+                    body.extend(chunk)
+                    if len(body) >= MAX_HTML_BYTES:
+                        logger.info(
+                            f"⚠️  HTML이 {MAX_HTML_BYTES // (1024 * 1024)}MB를 초과하여 일부만 사용: {url}"
                         )
-                    except Exception:
-                        pass  # 특정 요소를 찾지 못해도 계속 진행
+                        break
+                content = body.decode(response.charset or "utf-8", errors="replace")
 
-                    # 추가 대기 (동적 콘텐츠)
-                    await page.wait_for_timeout(2000)
+            logger.info(f"📄 정적 HTML 가져옴: {len(content)} chars from {url}")
+            return content
 
-                    # 네트워크 완료 대기 (선택적)
-                    try:
-                        await page.wait_for_load_state("networkidle", timeout=5000)
-                    except Exception:
-                        pass  # 네트워크가 계속 활성화되어도 진행
+        except Exception as e:
+            logger.info(f"⚠️  정적 HTML 요청 실패: {str(e)}")
+            return None
+
+    async def aclose(self) -> None:
+        """직접 만든 브라우저 풀 종료 (스크래핑 종료 시 한 번 호출)"""
+        if self._owns_browser_pool:
+            await self.browser_pool.aclose()
+
+    async def _fetch_rendered_html(self, url: str) -> Optional[str]:
+        """Playwright를 사용하여 JavaScript 렌더링 후 HTML을 가져옵니다."""
+        try:
+            # 브라우저는 URL 간에 재사용하고 URL마다 가벼운 context만 새로 생성
+            async with self.browser_pool.context(
+                user_agent=_USER_AGENT,
+                viewport={"width": 1920, "height": 1080},
+            ) as context:
+                page = await context.new_page()
 
-                    # HTML 콘텐츠 가져오기
-                    content = await page.content()
+                # 페이지 로드 (같은 도메인 요청 간격 준수)
+                await domain_rate_limiter.acquire(url)
+                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
 
-                    tqdm.write(
-                        f"🌐 Playwright HTML 가져옴: {len(content)} chars from {url}"
+                # 콘텐츠 요소가 로드될 때까지 대기 (고정 대기 없이 나타나면 바로 진행)
+                try:
+                    await page.wait_for_selector(
+                        "main, .content, .product, h1, h2, p", timeout=10000
                     )
-                    return content
+                except Exception:
+                    pass  # 특정 요소를 찾지 못해도 계속 진행
 
-                except Exception as e:
-                    tqdm.write(f"❌ Playwright 페이지 로드 실패: {str(e)}")
-                    return None
-                finally:
-                    await browser.close()
+                # 동적 콘텐츠를 불러오는 네트워크 요청 완료 대기 (선택적)
+                try:
+                    await page.wait_for_load_state("networkidle", timeout=5000)
+                except Exception:
+                    pass  # 네트워크가 계속 활성화되어도 진행
+
+                # HTML 콘텐츠 가져오기
+                content = await page.content()
+
+            logger.info(f"🌐 Playwright HTML 가져옴: {len(content)} chars from {url}")
+            return content
 
         except Exception as e:
-            tqdm.write(f"❌ Playwright 초기화 실패: {str(e)}")
+            logger.info(f"❌ Playwright 페이지 로드 실패: {str(e)}")
             return None
 
     def _create_extraction_prompt(self, text_content: str, source_url: str) -> str:
@@ -182,6 +445,22 @@ class LLMTreatmentExtractor:
             "product_extraction", text_content=text_content, source_url=source_url
         )
 
+    def _create_batch_extraction_prompt(
+        self, text_contents: List[str], source_urls: List[str]
+    ) -> str:
+        """여러 페이지를 page_index로 구분하여 배치 추출 프롬프트 생성"""
+        pages_content = "\n\n".join(
+            f"[페이지 {index}]\n출처 URL: {source_url}\n{text_content}"
+            for index, (text_content, source_url) in enumerate(
+                zip(text_contents, source_urls)
+            )
+        )
+        return self.prompt_manager.format_prompt(
+            "product_extraction_batch",
+            pages_content=pages_content,
+            page_count=len(source_urls),
+        )
+
     def get_model_info(self) -> Dict[str, Any]:
         """현재 사용 중인 모델 정보와 프롬프트 버전 반환"""
         model_info = self.llm_provider.get_model_info()
@@ -195,47 +474,137 @@ class LLMTreatmentExtractor:
 
     async def _make_api_request_with_retry_async(
         self, prompt: str, source_url: str, text_content: str, max_retries: int = 3
-    ) -> List[ProductItem]:
-        """비동기 API 요청 (재시도 로직 포함)"""
+    ) -> Optional[List[ProductItem]]:
+        """비동기 API 요청 (재시도 로직 포함, 같은 프롬프트는 캐시된 결과 사용, 실패하면 None)"""
+        # 디스크 캐시는 실행 간에 유지되므로 모델이 바뀌면 다른 키를 사용
+        cache_key = make_cache_key(
+            self.provider_type, self.llm_provider.get_model_info()["model"], prompt
+        )
+        cached = self._get_cached_products(cache_key)
+        if cached is not None:
+            logger.info(f"💾 캐시된 추출 결과 사용: {len(cached)}개 ({source_url})")
+            # 호출 측이 결과를 수정해도 캐시가 바뀌지 않도록 복사본 반환
+            return [product.model_copy(deep=True) for product in cached]
+
+        response_text = await self._generate_with_retry_async(
+            prompt, len(text_content), max_retries
+        )
+        if response_text is None:
+            return None
+
+        result = self._parse_llm_response(response_text, source_url)
+        if result is None:
+            return None
+        logger.info(f"✅ {len(result)}개 시술 정보 추출 완료")
+
+        # 실패와 구분되지 않는 빈 결과는 캐시하지 않음
+        if result:
+            self._remember_products(cache_key, result)
+            self.llm_disk_cache.set(
+                cache_key, [product.model_dump(mode="json") for product in result]
+            )
+        return result
+
+    def _get_cached_products(self, cache_key: str) -> Optional[List[ProductItem]]:
+        """메모리 LRU → 디스크 캐시 순으로 추출 결과 조회 (없으면 None)"""
+        cached = self._llm_cache.get(cache_key)
+        if cached is not None:
+            self._llm_cache.move_to_end(cache_key)
+            return cached
+
+        cached_json = self.llm_disk_cache.get(cache_key)
+        if not cached_json:
+            return None
+        try:
+            cached = [ProductItem.model_validate(item) for item in cached_json]
+        except ValidationError:
+            # 스키마가 바뀌어 읽을 수 없는 항목은 캐시 미스로 처리
+            return None
+        self._remember_products(cache_key, cached)
+        return cached
+
+    def _remember_products(self, cache_key: str, products: List[ProductItem]) -> None:
+        """메모리 LRU 캐시에 추출 결과 저장 (크기 초과 시 가장 오래된 항목 제거)"""
+        self._llm_cache[cache_key] = list(products)
+        if len(self._llm_cache) > LLM_CACHE_SIZE:
+            self._llm_cache.popitem(last=False)
+
+    async def _make_batch_api_request_with_retry_async(
+        self, text_contents: List[str], source_urls: List[str], max_retries: int = 3
+    ) -> List[Optional[List[ProductItem]]]:
+        """여러 페이지를 한 번의 API 요청으로 추출 (배치 응답 해석 실패 시 페이지별 요청)"""
+        prompt = self._create_batch_extraction_prompt(text_contents, source_urls)
+        total_length = sum(len(text_content) for text_content in text_contents)
+        logger.info(f"📦 {len(source_urls)}개 페이지를 하나의 요청으로 추출")
+
+        response_text = await self._generate_with_retry_async(
+            prompt, total_length, max_retries
+        )
+        if response_text is None:
+            return [None for _ in source_urls]
+
+        results = self._parse_llm_batch_response(response_text, source_urls)
+        if results is not None:
+            logger.info(
+                f"✅ {sum(len(products or []) for products in results)}개 시술 정보 추출 완료 ({len(source_urls)}개 페이지)"
+            )
+            return results
+
+        # 배치 응답 형식이 맞지 않으면 페이지별 개별 요청으로 대체
+        logger.info("🔁 배치 응답 해석 실패, 페이지별 요청으로 재시도")
+        return list(
+            await asyncio.gather(
+                *(
+                    self._make_api_request_with_retry_async(
+                        self._create_extraction_prompt(text_content, source_url),
+                        source_url,
+                        text_content,
+                        max_retries,
+                    )
+                    for text_content, source_url in zip(text_contents, source_urls)
+                )
+            )
+        )
+
+    async def _generate_with_retry_async(
+        self, prompt: str, text_length: int, max_retries: int
+    ) -> Optional[str]:
+        """비동기 LLM 호출 (rate limit 시 재시도, 실패하면 None)"""
+        # 인증 오류/재시도 후에도 남은 rate limit은 다른 요청도 실패하므로 예외로 전달
         for attempt in range(max_retries):
             try:
-                tqdm.write(
-                    f"🤖 {self.provider_type.title()}로 데이터 추출 중... ({len(text_content)} chars) - 시도 {attempt + 1}/{max_retries}"
+                logger.info(
+                    f"🤖 {self.provider_type.title()}로 데이터 추출 중... ({text_length} chars) - 시도 {attempt + 1}/{max_retries}"
                 )
 
-                response_text = await self.llm_provider.generate_async(prompt)
-                result = self._parse_llm_response(response_text, source_url)
-
-                tqdm.write(f"✅ {len(result)}개 시술 정보 추출 완료")
-                return result
+                return await self.llm_provider.generate_async(prompt)
 
             except Exception as e:
                 error_msg = str(e)
-                tqdm.write(
+                logger.info(
                     f"❌ {self.provider_type.title()} API 오류 (시도 {attempt + 1}/{max_retries}): {error_msg}"
                 )
 
+                if _AUTH_ERROR_RE.search(error_msg):
+                    raise LLMAuthError(error_msg) from e
+
                 # Rate limit 처리
-                if (
-                    "429" in error_msg
-                    or "quota" in error_msg.lower()
-                    or "exceeded" in error_msg.lower()
-                ):
+                if _RATE_LIMIT_RE.search(error_msg):
                     if attempt < max_retries - 1:
                         wait_time = (2**attempt) * 30
-                        tqdm.write(
+                        logger.info(
                             f"⏳ Rate limit 초과. {wait_time}초 대기 후 재시도..."
                         )
                         await asyncio.sleep(wait_time)
                         continue
                     else:
-                        tqdm.write("❌ 최대 재시도 횟수 도달. 요청을 건너뜁니다.")
-                        return []
+                        logger.info("❌ 최대 재시도 횟수 도달. 요청을 건너뜁니다.")
+                        raise LLMRateLimitError(error_msg) from e
                 else:
-                    tqdm.write(f"❌ API 요청 실패: {error_msg}")
-                    return []
+                    logger.info(f"❌ API 요청 실패: {error_msg}")
+                    return None
 
-        return []
+        return None
 
     def _make_api_request_with_retry(
         self, prompt: str, source_url: str, text_content: str, max_retries: int = 3
@@ -243,54 +612,84 @@ class LLMTreatmentExtractor:
         """동기 API 요청 (재시도 로직 포함)"""
         for attempt in range(max_retries):
             try:
-                tqdm.write(
+                logger.info(
                     f"🤖 {self.provider_type.title()}로 데이터 추출 중... ({len(text_content)} chars) - 시도 {attempt + 1}/{max_retries}"
                 )
 
                 response_text = self.llm_provider.generate(prompt)
-                result = self._parse_llm_response(response_text, source_url)
+                result = self._parse_llm_response(response_text, source_url) or []
 
-                tqdm.write(f"✅ {len(result)}개 시술 정보 추출 완료")
+                logger.info(f"✅ {len(result)}개 시술 정보 추출 완료")
                 return result
 
             except Exception as e:
                 error_msg = str(e)
-                tqdm.write(
+                logger.info(
                     f"❌ {self.provider_type.title()} API 오류 (시도 {attempt + 1}/{max_retries}): {error_msg}"
                 )
 
                 # Rate limit 처리
-                if (
-                    "429" in error_msg
-                    or "quota" in error_msg.lower()
-                    or "exceeded" in error_msg.lower()
-                ):
+                if _RATE_LIMIT_RE.search(error_msg):
                     if attempt < max_retries - 1:
                         wait_time = (2**attempt) * 30
-                        tqdm.write(
+                        logger.info(
                             f"⏳ Rate limit 초과. {wait_time}초 대기 후 재시도..."
                         )
                         time.sleep(wait_time)
                         continue
                     else:
-                        tqdm.write("❌ 최대 재시도 횟수 도달. 요청을 건너뜁니다.")
+                        logger.info("❌ 최대 재시도 횟수 도달. 요청을 건너뜁니다.")
                         return []
                 else:
-                    tqdm.write(f"❌ API 요청 실패: {error_msg}")
+                    logger.info(f"❌ API 요청 실패: {error_msg}")
                     return []
 
         return []
 
     def _parse_llm_response(
         self, response_text: str, source_url: str
-    ) -> List[ProductItem]:
-        """LLM 응답을 파싱하여 ProductItem 리스트로 변환"""
+    ) -> Optional[List[ProductItem]]:
+        """LLM 응답을 파싱하여 ProductItem 리스트로 변환 (해석할 수 없으면 None)"""
+        data = self._load_llm_json(response_text, source_url)
+        if data is None:
+            return None
+
+        try:
+            return self._build_products(data, source_url)
+        except Exception as e:
+            logger.info(f"❌ 응답 파싱 오류: {str(e)}")
+            return None
+
+    def _parse_llm_batch_response(
+        self, response_text: str, source_urls: List[str]
+    ) -> Optional[List[Optional[List[ProductItem]]]]:
+        """배치 LLM 응답을 페이지별 ProductItem 리스트로 변환 (형식이 맞지 않으면 None)"""
+        # 응답에 없거나 파싱에 실패한 페이지는 해당 항목만 None
+        data = self._load_llm_json(response_text, source_urls[0])
+        if not isinstance(data, dict) or not isinstance(data.get("pages"), list):
+            logger.info("⚠️  배치 응답에서 pages 배열을 찾을 수 없습니다")
+            return None
+
+        results: List[Optional[List[ProductItem]]] = [None for _ in source_urls]
+        for page_data in data["pages"]:
+            try:
+                index = int(page_data.get("page_index"))
+                if not 0 <= index < len(source_urls):
+                    raise IndexError(f"잘못된 page_index: {index}")
+                results[index] = self._build_products(page_data, source_urls[index])
+            except Exception as e:
+                logger.info(f"⚠️  배치 응답 페이지 파싱 오류: {str(e)}")
+                continue
+
+        return results
+
+    def _load_llm_json(self, response_text: str, source_url: str) -> Optional[Any]:
+        """LLM 응답에서 JSON을 추출하여 파싱 (실패하면 None)"""
         try:
             # 마크다운 코드 블록 제거 (```json ... ``` 형식)
             if "```json" in response_text:
                 # 코드 블록에서 JSON 부분만 추출
-                json_pattern = r"```json\s*(.*?)\s*```"
-                json_match = re.search(json_pattern, response_text, re.DOTALL)
+                json_match = _JSON_CODE_BLOCK_RE.search(response_text)
                 if json_match:
                     json_str = json_match.group(1).strip()
                 else:
@@ -299,51 +698,30 @@ class LLMTreatmentExtractor:
                     json_str = response_text[json_start:].strip()
             else:
                 # 일반 JSON 추출
-                json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
+                json_match = _JSON_OBJECT_RE.search(response_text)
                 if not json_match:
-                    tqdm.write("⚠️  JSON 형식을 찾을 수 없습니다")
-                    tqdm.write(f"응답 텍스트 샘플: {response_text[:200]}...")
-                    return []
+                    logger.info("⚠️  JSON 형식을 찾을 수 없습니다")
+                    logger.info(f"응답 텍스트 샘플: {response_text[:200]}...")
+                    return None
                 json_str = json_match.group()
 
             # JSON 파싱 전 디버깅 정보
-            tqdm.write(f"🔍 JSON 길이: {len(json_str)} 문자")
+            logger.info(f"🔍 JSON 길이: {len(json_str)} 문자")
 
-            # JSON 유효성 검사 및 파싱
-            data = json.loads(json_str)
-
-            # 공통 정보 추출
-            clinic_name = data.get("clinic_name") or self._extract_clinic_name(
-                source_url
-            )
-            category = data.get("category")
-            description = data.get("description")
-
-            products = []
-            for product_data in data.get("products", []):
-                try:
-                    product = self._create_product_item(
-                        product_data, source_url, clinic_name, category, description
-                    )
-                    if product:
-                        products.append(product)
-                except Exception as e:
-                    tqdm.write(f"⚠️  상품 파싱 오류: {str(e)}")
-                    continue
+            # JSON 유효성 검사 및 파싱 (orjson: stdlib json 대비 빠른 C 구현)
+            return orjson.loads(json_str)
 
-            return products
-
-        except json.JSONDecodeError as e:
-            tqdm.write(f"❌ JSON 파싱 오류: {str(e)}")
+        except orjson.JSONDecodeError as e:
+            logger.info(f"❌ JSON 파싱 오류: {str(e)}")
 
             # 오류 위치 주변 텍스트 표시
             error_pos = getattr(e, "pos", 0)
             start_pos = max(0, error_pos - 100)
             end_pos = min(len(json_str), error_pos + 100)
 
-            tqdm.write("🔍 오류 위치 주변 텍스트:")
-            tqdm.write(f"   {json_str[start_pos:end_pos]}")
-            tqdm.write(f"📝 전체 JSON 길이: {len(json_str)}")
+            logger.info("🔍 오류 위치 주변 텍스트:")
+            logger.info(f"   {json_str[start_pos:end_pos]}")
+            logger.info(f"📝 전체 JSON 길이: {len(json_str)}")
 
             # 에러 데이터를 파일로 저장
             self._save_error_data(response_text, json_str, str(e), source_url)
@@ -353,40 +731,47 @@ class LLMTreatmentExtractor:
                 # 일반적인 JSON 오류 수정 시도
                 fixed_json = self._try_fix_json(json_str)
                 if fixed_json:
-                    data = json.loads(fixed_json)
-                    tqdm.write("✅ JSON 수정 성공!")
-
-                    # 공통 정보 추출 (수정된 JSON으로)
-                    clinic_name = data.get("clinic_name") or self._extract_clinic_name(
-                        source_url
-                    )
-                    category = data.get("category")
-                    description = data.get("description")
-
-                    products = []
-                    for product_data in data.get("products", []):
-                        try:
-                            product = self._create_product_item(
-                                product_data,
-                                source_url,
-                                clinic_name,
-                                category,
-                                description,
-                            )
-                            if product:
-                                products.append(product)
-                        except Exception as e:
-                            tqdm.write(f"⚠️  상품 파싱 오류: {str(e)}")
-                            continue
-
-                    return products
+                    data = orjson.loads(fixed_json)
+                    logger.info("✅ JSON 수정 성공!")
+                    return data
             except Exception:
                 pass
 
-            return []
+            return None
         except Exception as e:
-            tqdm.write(f"❌ 응답 파싱 오류: {str(e)}")
-            return []
+            logger.info(f"❌ 응답 파싱 오류: {str(e)}")
+            return None
+
+    def _build_products(
+        self, data: Dict[str, Any], source_url: str
+    ) -> List[ProductItem]:
+        """파싱된 LLM 응답에서 ProductItem 리스트 생성"""
+        # 공통 정보 추출
+        clinic_name = data.get("clinic_name") or self._extract_clinic_name(source_url)
+        category = data.get("category")
+        description = data.get("description")
+
+        # 한 응답의 상품들은 같은 시각에 수집된 것으로 기록 (상품마다 datetime.now() 호출 방지)
+        scraped_at = datetime.now()
+
+        products = []
+        for product_data in data.get("products", []):
+            try:
+                product = self._create_product_item(
+                    product_data,
+                    source_url,
+                    clinic_name,
+                    category,
+                    description,
+                    scraped_at,
+                )
+                if product:
+                    products.append(product)
+            except Exception as e:
+                logger.info(f"⚠️  상품 파싱 오류: {str(e)}")
+                continue
+
+        return products
 
     def _try_fix_json(self, json_str: str) -> Optional[str]:
         """JSON 문자열 수정 시도"""
@@ -408,18 +793,20 @@ class LLMTreatmentExtractor:
 
                 if last_complete_pos > 0:
                     json_str = json_str[: last_complete_pos + 1]
-                    tqdm.write(f"🔧 JSON 끝부분 잘림 수정: {len(json_str)} 문자로 축소")
+                    logger.info(
+                        f"🔧 JSON 끝부분 잘림 수정: {len(json_str)} 문자로 축소"
+                    )
 
             # 2. 일반적인 JSON 구문 오류 수정
             # 마지막 쉼표 제거
-            json_str = re.sub(r",(\s*[}\]])", r"\1", json_str)
+            json_str = _TRAILING_COMMA_RE.sub(r"\1", json_str)
 
             # 3. 유효성 검사
-            json.loads(json_str)
+            orjson.loads(json_str)
             return json_str
 
         except Exception as e:
-            tqdm.write(f"⚠️  JSON 수정 실패: {str(e)}")
+            logger.info(f"⚠️  JSON 수정 실패: {str(e)}")
             return None
 
     def _save_error_data(
@@ -427,9 +814,6 @@ class LLMTreatmentExtractor:
     ):
         """JSON 파싱 에러 데이터를 파일로 저장"""
         try:
-            import os
-            from datetime import datetime
-
             # log/errors 디렉토리 생성
             os.makedirs("log/errors", exist_ok=True)
 
@@ -456,10 +840,10 @@ class LLMTreatmentExtractor:
                 f.write(json_str)
                 f.write("\n" + "-" * 40 + "\n")
 
-            tqdm.write(f"💾 에러 데이터 저장: {filename}")
+            logger.info(f"💾 에러 데이터 저장: {filename}")
 
         except Exception as save_error:
-            tqdm.write(f"⚠️  에러 데이터 저장 실패: {str(save_error)}")
+            logger.info(f"⚠️  에러 데이터 저장 실패: {str(save_error)}")
 
     def _create_product_item(
         self,
@@ -468,6 +852,7 @@ class LLMTreatmentExtractor:
         clinic_name: str,
         category: str,
         description: str,
+        scraped_at: datetime,
     ) -> Optional[ProductItem]:
         """딕셔너리에서 ProductItem 생성"""
         try:
@@ -492,7 +877,8 @@ class LLMTreatmentExtractor:
                 clinic_name=clinic_name,
                 product_name=product_name,
                 product_original_price=self._parse_price_value(
-                    product_data.get("product_original_price")
+                    product_data.get("product_original_price"),
+                    label=ORIGINAL_PRICE_LABEL_RE,
                 ),
                 product_event_price=self._parse_price_value(
                     product_data.get("product_event_price")
@@ -501,10 +887,11 @@ class LLMTreatmentExtractor:
                 treatments=treatments,
                 category=category,
                 description=description,
+                scraped_at=scraped_at,
             )
 
         except Exception as e:
-            tqdm.write(f"⚠️  ProductItem 생성 오류: {str(e)}")
+            logger.info(f"⚠️  ProductItem 생성 오류: {str(e)}")
             return None
 
     def _create_individual_treatment(
@@ -517,14 +904,9 @@ class LLMTreatmentExtractor:
                 return None
 
             # 시술 유형 매핑
-            type_mapping = {
-                "laser": TreatmentType.LASER,
-                "injection": TreatmentType.INJECTION,
-                "skincare": TreatmentType.SKINCARE,
-                "surgical": TreatmentType.SURGICAL,
-                "device": TreatmentType.DEVICE,
-            }
-            treatment_type = type_mapping.get(treatment_data.get("treatment_type"))
+            treatment_type = _TREATMENT_TYPE_MAPPING.get(
+                treatment_data.get("treatment_type")
+            )
 
             return IndividualTreatment(
                 name=name,
@@ -541,62 +923,30 @@ class LLMTreatmentExtractor:
             )
 
         except Exception as e:
-            tqdm.write(f"⚠️  IndividualTreatment 생성 오류: {str(e)}")
+            logger.info(f"⚠️  IndividualTreatment 생성 오류: {str(e)}")
             return None
 
-    def _parse_price_value(self, price_value: Any) -> Optional[float]:
-        """가격 값을 파싱하되 None일 경우 None 반환"""
+    def _parse_price_value(
+        self, price_value: Any, label: Pattern[str] = SALE_PRICE_LABEL_RE
+    ) -> Optional[float]:
+        """가격 값을 파싱하되 None일 경우 None 반환 (여러 가격이 있으면 label 뒤의 가격)"""
         if price_value is None:
             return None
         if isinstance(price_value, str):
-            price_str = re.sub(r"[^\d]", "", price_value)
-            return float(price_str) if price_str else None
+            price = parse_won(price_value, label)
+            return float(price) if price is not None else None
         return float(price_value) if price_value else None
 
     def _extract_source_channel(self, source_url: str) -> str:
         """URL에서 정보 수집 채널명 추출"""
-        if "xenia.clinic" in source_url:
-            return "세니아 클리닉"
-        elif "feeline.network" in source_url:
-            return "피라인 네트워크"
-        elif "gu.clinic" in source_url:
-            return "GU 클리닉"
-        elif "beautyleader.co.kr" in source_url:
-            return "뷰티리더"
-        elif "global.ppeum.com" in source_url:
-            return "쁨글로벌의원"
-        else:
-            try:
-                from urllib.parse import urlparse
-
-                domain = urlparse(source_url).netloc
-                return domain.replace("www.", "")
-            except Exception:
-                return "알 수 없음"
+        try:
+            return _source_channel_for_host(parse_url(source_url).netloc)
+        except Exception:
+            return "알 수 없음"
 
     def _extract_clinic_name(self, source_url: str) -> str:
         """URL에서 클리닉 이름 추출"""
-        if "xenia.clinic" in source_url:
-            return "세니아 클리닉"
-        elif "feeline.network" in source_url:
-            return "피라인 네트워크"
-        elif "gu.clinic" in source_url:
-            return "GU 클리닉"
-        elif "beautyleader.co.kr" in source_url:
-            return "뷰티리더"
-        elif "global.ppeum.com" in source_url:
-            return "쁨글로벌의원"
-        else:
-            try:
-                from urllib.parse import urlparse
-
-                domain = urlparse(source_url).netloc.replace("www.", "")
-                if "clinic" in domain:
-                    return (
-                        domain.replace(".com", "").replace(".co.kr", "").title()
-                        + " 클리닉"
-                    )
-                else:
-                    return domain.replace(".com", "").replace(".co.kr", "").title()
-            except Exception:
-                return "알 수 없는 클리닉"
+        try:
+            return _clinic_name_for_host(parse_url(source_url).netloc)
+        except Exception:
+            return "알 수 없는 클리닉"
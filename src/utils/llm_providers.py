@@ -3,10 +3,20 @@ import time
 import asyncio
 from typing import Dict, Any
 from abc import ABC, abstractmethod
-from tqdm import tqdm
 
+from src.utils.log import get_logger
 from src.utils.prompt_manager import PromptManager
 
+logger = get_logger(__name__)
+
+
+class LLMAuthError(Exception):
+    """API 키/권한 오류 (재시도해도 실패하므로 남은 요청을 중단해야 함)"""
+
+
+class LLMRateLimitError(Exception):
+    """재시도 후에도 해소되지 않은 rate limit/할당량 초과"""
+
 
 class LLMProvider(ABC):
     """LLM 제공자를 위한 추상 기본 클래스"""
@@ -40,7 +50,7 @@ class LLMProvider(ABC):
 
         if time_since_last_request < self.min_delay_between_requests:
             wait_time = self.min_delay_between_requests - time_since_last_request
-            tqdm.write(f"⏱️ Rate limiting: {wait_time:.1f}초 대기 중...")
+            logger.info(f"⏱️ Rate limiting: {wait_time:.1f}초 대기 중...")
             time.sleep(wait_time)
 
         self.last_request_time = time.time()
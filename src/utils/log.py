@@ -0,0 +1,45 @@
+"""
+스크래퍼 로깅 설정
+터미널 출력은 백그라운드 스레드에서 처리하여 이벤트 루프가 stdout 쓰기로 멈추지 않도록 함
+"""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# 스크래퍼 모듈들의 공통 상위 로거 이름
+ROOT_LOGGER_NAME = "src"
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """큐 기반 핸들러 설정 (여러 번 호출해도 한 번만 적용)"""
+    global _listener
+    if _listener is not None:
+        return
+
+    # 기존 print 출력과 같은 형태(메시지만)로 stdout에 출력
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    # 로그 레코드는 큐에 넣기만 하고 실제 출력은 리스너 스레드가 담당
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(level)
+    root_logger.propagate = False
+
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+    # 종료 시 큐에 남은 로그를 모두 출력
+    atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """모듈 로거 반환 (최초 호출 시 로깅 설정)"""
+    setup_logging()
+    return logging.getLogger(name)
@@ -0,0 +1,85 @@
+"""
+원화 가격 문자열 파싱 유틸리티
+"""
+
+import re
+from typing import Optional, Pattern
+
+# 금액 표기 하나 ("99,000원", "₩ 99,000", "30만원", "1.5만원", "5천원", "10만 5천원", "10만 5,000원")
+# 만 뒤의 나머지 금액은 원이 이어질 때만 같은 금액으로 묶음 ("30만 3회"의 3은 제외)
+_AMOUNT_RE = re.compile(
+    r"(?P<won_sign>₩)?\s*(?P<number>\d[\d,]*(?:\.\d+)?)"
+    r"(?:\s*(?P<man>만)(?:\s*(?P<sub>\d[\d,]*)\s*(?P<sub_cheon>천)?(?=\s*원))?"
+    r"|\s*(?P<cheon>천))?"
+    r"(?P<won>\s*원)?"
+)
+
+# 범위 표기 구분자 ("10,000~20,000원", "10-20만원")
+_RANGE_SEP_RE = re.compile(r"\s*[~\-–]\s*")
+
+# 가격 종류 라벨 ("정상가 ₩120,000 / 이벤트가 ₩99,000"처럼 여러 가격이 함께 있을 때 사용)
+SALE_PRICE_LABEL_RE = re.compile(r"이벤트\s*가|할인\s*가|특가|판매\s*가")
+ORIGINAL_PRICE_LABEL_RE = re.compile(r"정상\s*가|정가|할인\s*전")
+
+
+def _to_number(digits: str) -> float:
+    digits = digits.replace(",", "")
+    return float(digits) if "." in digits else int(digits)
+
+
+def _is_marked(match: re.Match) -> bool:
+    """₩/원/만/천 표기가 붙은 금액인지 (횟수/용량 등 단순 숫자와 구분)"""
+    return any(match.group(name) for name in ("won_sign", "man", "cheon", "won"))
+
+
+def _unit_multiplier(match: re.Match) -> int:
+    if match.group("man"):
+        return 10000
+    if match.group("cheon"):
+        return 1000
+    return 1
+
+
+def _amount(match: re.Match) -> int:
+    """매칭된 금액 표기를 원 단위 정수로 변환"""
+    amount = _to_number(match.group("number")) * _unit_multiplier(match)
+    if match.group("sub"):
+        sub = _to_number(match.group("sub"))
+        amount += sub * 1000 if match.group("sub_cheon") else sub
+    return round(amount)
+
+
+def _first_price(text: str) -> Optional[int]:
+    """금액 표기가 붙은 첫 번째 가격 반환 (표기가 없으면 첫 번째 숫자 사용)"""
+    matches = list(_AMOUNT_RE.finditer(text))
+    for index, match in enumerate(matches):
+        if not _is_marked(match):
+            continue
+
+        # 범위 표기는 앞쪽 금액 사용 (단위는 뒤쪽 금액의 만/천을 따름)
+        previous = matches[index - 1] if index else None
+        if (
+            previous is not None
+            and not _is_marked(previous)
+            and not match.group("sub")
+            and _RANGE_SEP_RE.fullmatch(text, previous.end(), match.start())
+        ):
+            return round(_to_number(previous.group("number")) * _unit_multiplier(match))
+        return _amount(match)
+
+    return _amount(matches[0]) if matches else None
+
+
+def parse_won(
+    text: str, label: Optional[Pattern[str]] = SALE_PRICE_LABEL_RE
+) -> Optional[int]:
+    """가격 문자열에서 가격을 원 단위 정수로 변환 (가격이 없으면 None)"""
+    # 라벨이 붙은 가격이 있으면 라벨 뒤의 가격 사용 (기본: 이벤트/할인가)
+    if label is not None:
+        labeled = label.search(text)
+        if labeled:
+            price = _first_price(text[labeled.end() :])
+            if price is not None:
+                return price
+
+    return _first_price(text)
@@ -0,0 +1,86 @@
+"""
+도메인(netloc) 단위 요청 간격/동시 실행 수 제한
+서로 다른 도메인은 동시에 진행하고, 같은 도메인 요청만 rate_limit 간격으로 직렬화
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+from src.utils.url_utils import parse_url
+
+
+class DomainRateLimiter:
+    """도메인별 최소 요청 간격을 보장하는 rate limiter"""
+
+    def __init__(self):
+        self._intervals: Dict[str, float] = {}
+        # 도메인별 다음 요청이 허용되는 시각 (이미 예약된 요청 포함)
+        self._next_slot: Dict[str, float] = {}
+
+    def register(self, url: str, interval: float) -> None:
+        """URL의 도메인에 최소 요청 간격(초) 등록"""
+        netloc = parse_url(url).netloc
+        # 같은 도메인에 여러 설정이 있으면 더 보수적인 간격 사용
+        self._intervals[netloc] = max(interval, self._intervals.get(netloc, 0.0))
+
+    async def acquire(self, url: str) -> None:
+        """해당 도메인의 이전 요청 이후 최소 간격이 지날 때까지 대기"""
+        netloc = parse_url(url).netloc
+        interval = self._intervals.get(netloc, 0.0)
+        if interval <= 0:
+            return
+
+        # await 없이 요청 시각을 먼저 예약하므로 lock 없이도 같은 도메인 요청은 간격 유지
+        # 대기 중에 다른 요청(다른 도메인 포함)을 막지 않고, 이벤트 루프에도 묶이지 않음
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(netloc, 0.0))
+        self._next_slot[netloc] = slot + interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class HostConcurrencyLimiter:
+    """호스트별 동시 요청 수와 프로세스 전체 동시 요청 수를 함께 제한"""
+
+    def __init__(self, total: int):
+        self._total_limit = total
+        # semaphore는 이벤트 루프마다 새로 생성 (asyncio.run을 여러 번 호출해도 사용 가능)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._total: Optional[asyncio.Semaphore] = None
+        # (호스트, 호스트별 제한) → semaphore
+        self._host_sems: Dict[Tuple[str, int], asyncio.Semaphore] = {}
+
+    def _bind_loop(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프용 전체 semaphore 반환 (루프가 바뀌었으면 모두 다시 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._total = asyncio.Semaphore(self._total_limit)
+            self._host_sems = {}
+        return self._total
+
+    def _sem_for(self, url: str, per_host: int) -> asyncio.Semaphore:
+        """URL 호스트와 per_host 제한에 해당하는 semaphore (없을 때만 생성)"""
+        # 같은 호스트라도 설정마다 max_concurrency_per_host가 다를 수 있으므로 제한 값도 키에 포함
+        key = (parse_url(url).netloc, per_host)
+        sem = self._host_sems.get(key)
+        if sem is None:
+            sem = self._host_sems[key] = asyncio.Semaphore(per_host)
+        return sem
+
+    @contextlib.asynccontextmanager
+    async def limit(self, url: str, per_host: int) -> AsyncIterator[None]:
+        """호스트 슬롯을 먼저 얻은 뒤 전체 슬롯 획득 (호스트 대기 중 전체 슬롯을 점유하지 않음)"""
+        total = self._bind_loop()
+        async with self._sem_for(url, per_host), total:
+            yield
+
+
+# 프로세스 전체에서 동시에 진행하는 요청 수 상한
+MAX_TOTAL_CONCURRENCY = 20
+
+# 전역 rate limiter 인스턴스
+domain_rate_limiter = DomainRateLimiter()
+host_concurrency_limiter = HostConcurrencyLimiter(MAX_TOTAL_CONCURRENCY)
@@ -0,0 +1,59 @@
+"""
+렌더링된 HTML 스냅샷 디스크 캐시
+개발 중 반복 실행 시 브라우저 렌더링/상호작용을 건너뛰기 위해 사용
+"""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+
+# 기본 캐시 유지 시간 (48시간)
+DEFAULT_CACHE_TTL = 48 * 3600
+
+
+def make_cache_key(*parts: Any) -> str:
+    """캐시 키 생성 (URL, 상호작용 설정 등을 묶어 해시)"""
+    raw = orjson.dumps(parts, default=str)
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class ScrapeCache:
+    """TTL 기반 파일 캐시 (키당 JSON 파일 하나)"""
+
+    def __init__(
+        self, directory: str = ".scrape_cache", ttl: float = DEFAULT_CACHE_TTL
+    ):
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 값 반환 (없거나 만료되었으면 None)"""
+        path = self._path(key)
+        try:
+            entry = orjson.loads(path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return None
+
+        if entry.get("expires_at", 0) < time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """값 저장 (임시 파일에 쓴 뒤 교체하여 중간 상태가 읽히지 않도록 함)"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "expires_at": time.time() + (self.ttl if ttl is None else ttl),
+            "value": value,
+        }
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(orjson.dumps(entry))
+        os.replace(tmp_path, path)
@@ -0,0 +1,44 @@
+"""
+URL 파싱 유틸리티
+"""
+
+from functools import lru_cache
+from urllib.parse import SplitResult, parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 페이지 내용과 무관한 추적용 쿼리 파라미터
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "igshid"})
+
+
+@lru_cache(maxsize=8192)
+def parse_url(url: str) -> SplitResult:
+    """URL 파싱 결과 캐시 (rate limiter, 클리닉명 추출 등에서 같은 URL을 반복 파싱)"""
+    # urlparse와 달리 path의 ;params 분리를 하지 않아 더 가벼움
+    return urlsplit(url)
+
+
+@lru_cache(maxsize=8192)
+def canonicalize_url(url: str) -> str:
+    """같은 페이지를 가리키는 URL들을 하나의 형태로 정규화 (중복 fetch/LLM 호출 방지용 키)"""
+    parts = parse_url(url)
+
+    # 추적용 파라미터 제거 후 키 순서로 정렬
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.startswith("utm_") and key not in _TRACKING_PARAMS
+        )
+    )
+
+    # 해시 라우팅(#/..., #!...)이 아닌 fragment는 같은 페이지이므로 제거
+    fragment = parts.fragment if parts.fragment.startswith(("/", "!")) else ""
+
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/") or "/",
+            query,
+            fragment,
+        )
+    )
@@ -4,20 +4,30 @@
 
 import argparse
 import asyncio
-import json
+import contextlib
 import os
 from datetime import datetime
-from typing import List
+from pathlib import Path
+from typing import List, Optional
 
-from dotenv import load_dotenv
+import aiohttp
+import orjson
 
+try:
+    import uvloop
+except ImportError:  # uvloop 미설치(Windows 등) 시 기본 asyncio 이벤트 루프 사용
+    uvloop = None
+
+from src.config.env import load_env
 from src.config.site_configs import SiteConfigManager
 from src.models.schemas import ProductItem, ScrapingConfig
 from src.scrapers.configurable_scraper import ConfigurableScraper
+from src.utils.browser_pool import BrowserPool
+from src.utils.http import close_session, create_session
 from src.utils.llm_extractor import LLMTreatmentExtractor
 
 # .env 파일 로드
-load_dotenv()
+load_env()
 
 
 class TestScraper:
@@ -28,10 +38,15 @@ class TestScraper:
         provider_type: str,
         api_key: str,
         site_config: ScrapingConfig,
+        session: Optional[aiohttp.ClientSession] = None,
+        browser_pool: Optional[BrowserPool] = None,
     ):
         self.provider_type = provider_type.lower()
         self.api_key = api_key
-        self.llm_extractor = LLMTreatmentExtractor(provider_type, api_key)
+        self.session = session
+        self.llm_extractor = LLMTreatmentExtractor(
+            provider_type, api_key, session=session, browser_pool=browser_pool
+        )
         self.config = site_config
 
     async def scrape_treatments(self) -> List[ProductItem]:
@@ -48,7 +63,7 @@ class TestScraper:
             )
 
         try:
-            scraper = ConfigurableScraper(self.config, self.llm_extractor)
+            scraper = ConfigurableScraper(self.config, self.llm_extractor, self.session)
             products = await scraper.scrape_by_config()
 
             print("✅ 스크래핑 완료!")
@@ -97,11 +112,13 @@ class TestScraper:
                     len(product.treatments) for product in products
                 ),
             },
-            "results": [product.model_dump() for product in products],
+            "results": [product.model_dump(mode="json") for product in products],
         }
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(result_data, f, ensure_ascii=False, indent=2, default=str)
+        # orjson으로 직렬화 (UTF-8 그대로 출력, stdlib json 대비 빠름)
+        Path(filename).write_bytes(
+            orjson.dumps(result_data, default=str, option=orjson.OPT_INDENT_2)
+        )
 
         print(f"💾 결과 저장 완료: {filename}")
         print("📊 모델 정보:")
@@ -111,6 +128,12 @@ class TestScraper:
 
         return filename
 
+    async def save_results_async(
+        self, products: List[ProductItem], suffix: str = ""
+    ) -> str:
+        """결과 저장을 스레드에서 수행 (이벤트 루프를 막지 않음)"""
+        return await asyncio.to_thread(self.save_results, products, suffix)
+
 
 def get_api_key(provider_type: str) -> str:
     """환경변수에서 API 키 가져오기"""
@@ -169,35 +192,61 @@ async def main():
 
     print(f"🤖 {args.model.title()} 모델을 사용하여 스크래핑을 시작합니다...")
 
-    # print(f"쁨 글로벌 클리닉 스크래핑을 시작합니다...")
-
-    # # 스크래퍼 실행
-    ppeum_global_scraper = TestScraper(
-        args.model, api_key, SiteConfigManager().create_ppeum_global_config()
-    )
-    products = await ppeum_global_scraper.scrape_treatments()
-    print("쁨 글로벌 클리닉 스크래핑 완료!")
-
-    # 결과 저장
-    if products:
-        ppeum_global_scraper.save_results(products, args.suffix)
-    else:
-        print("📭 스크래핑된 데이터가 없습니다.")
-
-    print("세니아 클리닉 스크래핑을 시작합니다...")
-
-    xenia_scraper = TestScraper(
-        args.model, api_key, SiteConfigManager().get_config("xenia")
-    )
-    products = await xenia_scraper.scrape_treatments()
+    async with contextlib.AsyncExitStack() as exit_stack:
+        # 종료 시 등록의 역순으로 정리: 브라우저 풀 → 공유 세션 → 전역 세션
+        exit_stack.push_async_callback(close_session)
+
+        # 모든 사이트가 하나의 HTTP 세션(커넥션 풀/DNS 캐시)과 브라우저를 공유
+        session = await exit_stack.enter_async_context(create_session())
+        browser_pool = await exit_stack.enter_async_context(BrowserPool())
+
+        site_config_manager = SiteConfigManager()
+        site_scrapers = {
+            "쁨 글로벌 클리닉": TestScraper(
+                args.model,
+                api_key,
+                site_config_manager.create_ppeum_global_config(),
+                session,
+                browser_pool,
+            ),
+            "세니아 클리닉": TestScraper(
+                args.model,
+                api_key,
+                site_config_manager.get_config("xenia"),
+                session,
+                browser_pool,
+            ),
+        }
 
-    if products:
-        xenia_scraper.save_results(products, args.suffix)
-    else:
-        print("📭 스크래핑된 데이터가 없습니다.")
+        async def scrape_and_save(site_label: str, scraper: TestScraper) -> None:
+            """단일 사이트 스크래핑 후 결과 저장"""
+            print(f"{site_label} 스크래핑을 시작합니다...")
+            products = await scraper.scrape_treatments()
+            print(f"{site_label} 스크래핑 완료!")
 
-    print("세니아 클리닉 스크래핑 완료!")
+            # 결과 저장 (파일 쓰기는 스레드에서 수행하여 다른 사이트 스크래핑을 막지 않음)
+            if products:
+                await scraper.save_results_async(products, args.suffix)
+            else:
+                print("📭 스크래핑된 데이터가 없습니다.")
+
+        # 사이트별 스크래핑은 서로 독립적이므로 동시에 실행
+        # 한 사이트가 실패해도 공유 세션/브라우저를 닫기 전에 다른 사이트가 끝나도록 예외를 모음
+        results = await asyncio.gather(
+            *(
+                scrape_and_save(site_label, scraper)
+                for site_label, scraper in site_scrapers.items()
+            ),
+            return_exceptions=True,
+        )
+        for site_label, result in zip(site_scrapers, results):
+            if isinstance(result, BaseException):
+                print(f"❌ {site_label} 스크래핑 실패: {result!r}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop이 있으면 더 빠른 이벤트 루프에서 실행 (코루틴 코드는 그대로)
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
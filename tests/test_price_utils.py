@@ -0,0 +1,42 @@
+import unittest
+
+from src.utils.price_utils import ORIGINAL_PRICE_LABEL_RE, parse_won
+
+
+class ParseWonTest(unittest.TestCase):
+    def test_simple_formats(self):
+        self.assertEqual(parse_won("99,000원"), 99000)
+        self.assertEqual(parse_won("₩ 99,000"), 99000)
+        self.assertEqual(parse_won("30만원"), 300000)
+        self.assertEqual(parse_won("1.5만원"), 15000)
+        self.assertEqual(parse_won("5천원"), 5000)
+
+    def test_no_price(self):
+        self.assertIsNone(parse_won("가격 문의"))
+
+    def test_bare_number_fallback(self):
+        self.assertEqual(parse_won("99000"), 99000)
+
+    def test_skips_unmarked_count_before_price(self):
+        self.assertEqual(parse_won("3회 99,000원"), 99000)
+        self.assertEqual(parse_won("1cc 30만원"), 300000)
+
+    def test_man_cheon_compound(self):
+        self.assertEqual(parse_won("10만 5천원"), 105000)
+        self.assertEqual(parse_won("10만 5,000원"), 105000)
+        self.assertEqual(parse_won("30만 3회"), 300000)
+
+    def test_range_uses_lower_bound(self):
+        self.assertEqual(parse_won("10,000~20,000원"), 10000)
+        self.assertEqual(parse_won("10~20만원"), 100000)
+
+    def test_labeled_prices(self):
+        text = "정상가 ₩120,000 / 이벤트가 ₩99,000"
+        self.assertEqual(parse_won(text), 99000)
+        self.assertEqual(parse_won(text, ORIGINAL_PRICE_LABEL_RE), 120000)
+        self.assertEqual(parse_won("이벤트가 99,000원 (정상가 120,000원)"), 99000)
+        self.assertEqual(parse_won("정상가 120,000원", label=None), 120000)
+
+
+if __name__ == "__main__":
+    unittest.main()